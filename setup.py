@@ -27,7 +27,10 @@ setup(
     extras_require={
         'dev': [
             'pytest>=7.0.0',
-            'pytest-asyncio>=0.21.0',
+            'pytest-asyncio>=0.26.0',
+            'pytest-benchmark>=4.0.0',
+            'pytest-xdist>=3.0.0',
+            'respx>=0.20.0',
             'black>=23.0.0',
             'flake8>=6.0.0',
             'mypy>=1.0.0',
@@ -106,8 +106,8 @@ class FileWatcher:
 
                 # Utwórz zadania TODO z naruszeń
                 if hasattr(self.gollm_core, "todo_manager"):
-                    for violation in result["violations"][:3]:  # Max 3 zadania na plik
-                        self.gollm_core.todo_manager.add_task_from_violation(
+                    self.gollm_core.todo_manager.add_tasks_from_violations(
+                        (
                             violation.type,
                             {
                                 "file_path": file_path,
@@ -115,6 +115,8 @@ class FileWatcher:
                                 "message": violation.message,
                             },
                         )
+                        for violation in result["violations"][:3]  # Max 3 zadania na plik
+                    )
             else:
                 print(f"✅ No violations in {file_path}")
 
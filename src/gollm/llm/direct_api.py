@@ -1,6 +1,7 @@
 """Direct API access module for fast LLM requests without extensive validation."""
 
 import asyncio
+import importlib.util
 import json
 import logging
 import os
@@ -8,6 +9,17 @@ from typing import Any, Dict, List, Optional, Union
 
 import aiohttp
 
+# httpx is optional (``gollm[ollama]``); aiohttp remains the fallback
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+    # HTTP/2 support in httpx requires the optional ``h2`` package
+    HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+except ImportError:
+    HTTPX_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
 # Try to import gRPC-related modules
 try:
     from ..llm.providers.ollama.config import OllamaConfig
@@ -33,6 +45,7 @@ class DirectLLMClient:
         base_url: str = "http://localhost:11434",
         timeout: int = 30,
         use_grpc: bool = False,
+        grpc_pool_size: int = 1,
     ):
         """Initialize the direct LLM client.
 
@@ -40,18 +53,25 @@ class DirectLLMClient:
             base_url: Base URL of the LLM API server
             timeout: Request timeout in seconds
             use_grpc: Whether to use gRPC for faster communication
+            grpc_pool_size: Number of gRPC channels to round-robin requests over
         """
         self.base_url = base_url
         self.timeout = timeout
         self.use_grpc = use_grpc and ADAPTERS_AVAILABLE
+        self.grpc_pool_size = grpc_pool_size
         self.session: Optional[aiohttp.ClientSession] = None
+        self._client: Optional["httpx.AsyncClient"] = None
         self.adapter = None
 
     async def __aenter__(self):
         """Async context manager entry."""
         if self.use_grpc and ADAPTERS_AVAILABLE:
             # Create a config object for the adapter
-            config = OllamaConfig(base_url=self.base_url, timeout=self.timeout)
+            config = OllamaConfig(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                grpc_pool_size=self.grpc_pool_size,
+            )
 
             try:
                 # Try to create a gRPC adapter
@@ -65,16 +85,10 @@ class DirectLLMClient:
                 self.adapter = None
                 self.use_grpc = False
                 # Fall back to HTTP session
-                self.session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                    headers={"Content-Type": "application/json"},
-                )
+                self._open_http()
         else:
             # Use standard HTTP session
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers={"Content-Type": "application/json"},
-            )
+            self._open_http()
 
         return self
 
@@ -82,9 +96,49 @@ class DirectLLMClient:
         """Async context manager exit."""
         if self.adapter:
             await self.adapter.__aexit__(exc_type, exc_val, exc_tb)
+        elif self._client:
+            await self._client.aclose()
+            self._client = None
         elif self.session:
             await self.session.close()
 
+    def _open_http(self) -> None:
+        """Create the long-lived HTTP client if it does not exist yet.
+
+        Prefers ``httpx.AsyncClient`` (with HTTP/2 when ``h2`` is installed)
+        and falls back to ``aiohttp.ClientSession`` when httpx is missing.
+        """
+        if self._client or self.session:
+            return
+
+        if HTTPX_AVAILABLE:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url.rstrip("/"),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(self.timeout),
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Content-Type": "application/json"},
+            )
+
+    async def _post_json(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a JSON payload to ``path`` and return the decoded JSON body."""
+        self._open_http()
+
+        if self._client:
+            response = await self._client.post(path, json=payload)
+            response.raise_for_status()
+            return response.json()
+
+        url = f"{self.base_url.rstrip('/')}{path}"
+        async with self.session.post(url, json=payload) as response:
+            response.raise_for_status()
+            return await response.json()
+
     async def chat_completion(
         self,
         model: str,
@@ -135,13 +189,7 @@ class DirectLLMClient:
                 return {"error": str(e), "success": False}
 
         # Fall back to HTTP if gRPC is not available or failed
-        if not self.session:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers={"Content-Type": "application/json"},
-            )
-
-        url = f"{self.base_url.rstrip('/')}/api/chat"
+        path = "/api/chat"
 
         payload = {
             "model": model,
@@ -150,18 +198,16 @@ class DirectLLMClient:
             "options": {"temperature": temperature, "num_predict": max_tokens},
         }
 
-        logger.debug(f"Making direct chat request to {url} with model {model}")
+        logger.debug(f"Making direct chat request to {path} with model {model}")
         start_time = asyncio.get_event_loop().time()
 
         try:
-            async with self.session.post(url, json=payload) as response:
-                response.raise_for_status()
-                result = await response.json()
+            result = await self._post_json(path, payload)
 
-                duration = asyncio.get_event_loop().time() - start_time
-                logger.debug(f"Direct API request completed in {duration:.2f}s")
+            duration = asyncio.get_event_loop().time() - start_time
+            logger.debug(f"Direct API request completed in {duration:.2f}s")
 
-                return result
+            return result
 
         except Exception as e:
             logger.error(f"Direct API request failed: {str(e)}")
@@ -219,13 +265,7 @@ class DirectLLMClient:
                 return {"error": str(e), "success": False}
 
         # Fall back to HTTP if gRPC is not available or failed
-        if not self.session:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers={"Content-Type": "application/json"},
-            )
-
-        url = f"{self.base_url.rstrip('/')}/api/generate"
+        path = "/api/generate"
 
         payload = {
             "model": model,
@@ -234,18 +274,16 @@ class DirectLLMClient:
             "options": {"temperature": temperature, "num_predict": max_tokens},
         }
 
-        logger.debug(f"Making direct generate request to {url} with model {model}")
+        logger.debug(f"Making direct generate request to {path} with model {model}")
         start_time = asyncio.get_event_loop().time()
 
         try:
-            async with self.session.post(url, json=payload) as response:
-                response.raise_for_status()
-                result = await response.json()
+            result = await self._post_json(path, payload)
 
-                duration = asyncio.get_event_loop().time() - start_time
-                logger.debug(f"Direct API request completed in {duration:.2f}s")
+            duration = asyncio.get_event_loop().time() - start_time
+            logger.debug(f"Direct API request completed in {duration:.2f}s")
 
-                return result
+            return result
 
         except Exception as e:
             logger.error(f"Direct API request failed: {str(e)}")
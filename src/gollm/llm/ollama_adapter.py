@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -19,6 +20,7 @@ class OllamaConfig:
     timeout: int = 60
     max_tokens: int = 4000
     temperature: float = 0.1
+    keep_alive: Optional[str] = None  # e.g. "30m"; None uses the server default
 
 
 class OllamaAdapter:
@@ -44,20 +46,32 @@ class OllamaAdapter:
         trace_config.on_request_start.append(on_request_start)
         trace_config.on_request_end.append(on_request_end)
 
+        # Pooled keep-alive connections reused by every request of this adapter
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=self.config.timeout),
             trace_configs=[trace_config],
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30),
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+            self.session = None
+
+    @asynccontextmanager
+    async def _session(self, **session_kwargs):
+        """Zwraca współdzieloną sesję, a poza kontekstem - sesję tymczasową"""
+        if self.session is not None and not self.session.closed:
+            yield self.session
+            return
+        async with aiohttp.ClientSession(**session_kwargs) as session:
+            yield session
 
     async def is_available(self) -> bool:
         """Sprawdza czy Ollama jest dostępne"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(f"{self.config.base_url}/api/tags") as response:
                     return response.status == 200
         except Exception:
@@ -66,7 +80,7 @@ class OllamaAdapter:
     async def list_models(self) -> List[str]:
         """Zwraca listę dostępnych modeli"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(f"{self.config.base_url}/api/tags") as response:
                     if response.status == 200:
                         data = await response.json()
@@ -105,6 +119,8 @@ class OllamaAdapter:
                 "num_predict": self.config.max_tokens,
             },
         }
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
 
         # Log the request payload
         logger.debug(f"Sending request to Ollama API with model: {self.config.model}")
@@ -116,9 +132,11 @@ class OllamaAdapter:
         try:
             logger.debug(f"Sending POST request to: {url}")
 
-            # Create a new session for this request
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=payload, headers=headers) as response:
+            # Reuse the shared session when the adapter is used as a context manager
+            async with self._session(timeout=timeout) as session:
+                async with session.post(
+                    url, json=payload, headers=headers, timeout=timeout
+                ) as response:
                     response_text = await response.text()
                     logger.debug(f"Received response status: {response.status}")
 
@@ -523,6 +541,7 @@ class OllamaLLMProvider:
         self.temperature = config.get("temperature", 0.1)
         self.api_type = config.get("api_type", "chat")
         self.interactive = config.get("interactive", True)
+        self.keep_alive = config.get("keep_alive")
 
         logger.debug(f"Initializing OllamaLLMProvider with config: {config}")
 
@@ -536,6 +555,14 @@ class OllamaLLMProvider:
             f"Timeout: {self.timeout}"
         )
 
+    async def __aenter__(self):
+        """Opens the adapter's pooled HTTP session for reuse across requests"""
+        await self.adapter.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.adapter.__aexit__(exc_type, exc_val, exc_tb)
+
     def _update_adapter(self):
         """Update the Ollama adapter with current configuration"""
         ollama_config = OllamaConfig(
@@ -544,6 +571,7 @@ class OllamaLLMProvider:
             timeout=self.timeout,
             max_tokens=self.token_limit,
             temperature=self.temperature,
+            keep_alive=self.keep_alive,
         )
         self.adapter = OllamaAdapter(ollama_config)
 
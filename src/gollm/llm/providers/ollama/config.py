@@ -17,6 +17,7 @@ class OllamaConfig:
         api_key: Optional API key for authentication
         headers: Additional headers to include in requests
         adaptive_timeout: Whether to adjust timeout based on model size
+        grpc_pool_size: Number of gRPC channels to spread requests over
     """
 
     base_url: str = "http://localhost:11434"
@@ -28,6 +29,7 @@ class OllamaConfig:
     api_key: Optional[str] = None
     headers: Dict[str, str] = None
     adaptive_timeout: bool = True
+    grpc_pool_size: int = 1
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> "OllamaConfig":
@@ -42,6 +44,7 @@ class OllamaConfig:
             api_key=config_dict.get("api_key"),
             headers=config_dict.get("headers"),
             adaptive_timeout=config_dict.get("adaptive_timeout", cls.adaptive_timeout),
+            grpc_pool_size=config_dict.get("grpc_pool_size", cls.grpc_pool_size),
         )
 
     def get_adjusted_timeout(self, prompt_length: int = 0) -> int:
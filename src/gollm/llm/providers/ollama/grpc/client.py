@@ -43,8 +43,9 @@ class OllamaGrpcClient:
             )
 
         self.config = config
-        self._channel = None
-        self._stub = None
+        self._channels = []
+        self._stubs = []
+        self._next_stub_index = 0
 
         # Extract host and port from base_url
         # Example: http://localhost:11434 -> localhost:11434
@@ -64,15 +65,37 @@ class OllamaGrpcClient:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        # Create a gRPC channel
-        self._channel = grpc.aio.insecure_channel(self.server_address)
-        self._stub = ollama_pb2_grpc.OllamaServiceStub(self._channel)
+        # One HTTP/2 connection caps concurrent streams, so open a pool of
+        # channels. A local subchannel pool stops them sharing a connection.
+        pool_size = max(1, getattr(self.config, "grpc_pool_size", 1))
+        options = [("grpc.use_local_subchannel_pool", 1)] if pool_size > 1 else None
+        self._channels = [
+            grpc.aio.insecure_channel(self.server_address, options=options)
+            for _ in range(pool_size)
+        ]
+        self._stubs = [
+            ollama_pb2_grpc.OllamaServiceStub(channel) for channel in self._channels
+        ]
+        self._next_stub_index = 0
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._channel:
-            await self._channel.close()
+        channels, self._channels, self._stubs = self._channels, [], []
+        for channel in channels:
+            await channel.close()
+
+    def _next_stub(self):
+        """Return the next stub from the channel pool in round-robin order.
+
+        Returns:
+            A service stub, or None if the client is not initialized
+        """
+        if not self._stubs:
+            return None
+        stub = self._stubs[self._next_stub_index]
+        self._next_stub_index = (self._next_stub_index + 1) % len(self._stubs)
+        return stub
 
     async def generate(
         self, prompt: str, model: Optional[str] = None, **kwargs
@@ -94,7 +117,8 @@ class OllamaGrpcClient:
         Returns:
             Dictionary containing the generated text and metadata
         """
-        if not self._stub:
+        stub = self._next_stub()
+        if stub is None:
             raise RuntimeError(
                 "Client not initialized. Use 'async with' context manager."
             )
@@ -145,7 +169,7 @@ class OllamaGrpcClient:
 
         try:
             # Make the gRPC call
-            response = await self._stub.Generate(request, timeout=self.config.timeout)
+            response = await stub.Generate(request, timeout=self.config.timeout)
 
             duration = time.time() - start_time
             logger.debug(f"gRPC generate request completed in {duration:.2f}s")
@@ -211,7 +235,8 @@ class OllamaGrpcClient:
         Returns:
             Dictionary containing the generated response and metadata
         """
-        if not self._stub:
+        stub = self._next_stub()
+        if stub is None:
             raise RuntimeError(
                 "Client not initialized. Use 'async with' context manager."
             )
@@ -265,7 +290,7 @@ class OllamaGrpcClient:
 
         try:
             # Make the gRPC call
-            response = await self._stub.Chat(request, timeout=self.config.timeout)
+            response = await stub.Chat(request, timeout=self.config.timeout)
 
             duration = time.time() - start_time
             logger.debug(f"gRPC chat request completed in {duration:.2f}s")
@@ -327,14 +352,15 @@ class OllamaGrpcClient:
         Returns:
             Dictionary containing available models
         """
-        if not self._stub:
+        stub = self._next_stub()
+        if stub is None:
             raise RuntimeError(
                 "Client not initialized. Use 'async with' context manager."
             )
 
         try:
             request = ollama_pb2.ListModelsRequest()
-            response = await self._stub.ListModels(request, timeout=self.config.timeout)
+            response = await stub.ListModels(request, timeout=self.config.timeout)
 
             # Convert to dict format similar to HTTP API
             models = []
@@ -361,14 +387,15 @@ class OllamaGrpcClient:
         Returns:
             Dictionary containing health status
         """
-        if not self._stub:
+        stub = self._next_stub()
+        if stub is None:
             raise RuntimeError(
                 "Client not initialized. Use 'async with' context manager."
             )
 
         try:
             request = ollama_pb2.HealthRequest()
-            response = await self._stub.Health(request, timeout=self.config.timeout)
+            response = await stub.Health(request, timeout=self.config.timeout)
 
             return {
                 "success": response.healthy,
@@ -4,12 +4,15 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 import aiohttp
 
 logger = logging.getLogger("gollm.ollama.generation")
 
+# Read size for streamed NDJSON responses; one read usually holds many tokens
+STREAM_CHUNK_SIZE = 16 * 1024
+
 
 class OllamaGenerator:
     """Handles generation operations for Ollama models."""
@@ -441,6 +444,50 @@ class OllamaGenerator:
             async for chunk in self._generate_completion_stream(prompt, context):
                 yield chunk
 
+    async def _iter_ndjson_text(
+        self,
+        response: aiohttp.ClientResponse,
+        extract: Callable[[Dict[str, Any]], Optional[str]],
+    ) -> AsyncIterator[str]:
+        """Read an NDJSON stream in fixed-size chunks and yield coalesced text.
+
+        Every complete record in a network chunk is decoded and its text joined,
+        so the caller sees one chunk per read instead of one per token.
+
+        Args:
+            response: Streaming response from the Ollama API
+            extract: Returns the text of a decoded record, or None to skip it
+
+        Yields:
+            Text decoded from all complete records in each chunk read
+        """
+        buffer = b""
+        async for raw in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            *lines, buffer = (buffer + raw).split(b"\n")
+            parts = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    text = extract(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.error(f"Failed to parse JSON from stream: {line!r}")
+                    continue
+                if text:
+                    parts.append(text)
+            if parts:
+                yield "".join(parts)
+
+        # A final record may arrive without a trailing newline
+        if buffer.strip():
+            try:
+                text = extract(json.loads(buffer))
+            except json.JSONDecodeError:
+                logger.error(f"Failed to parse JSON from stream: {buffer!r}")
+            else:
+                if text:
+                    yield text
+
     async def _generate_chat_stream(
         self, prompt: str, context: Dict[str, Any]
     ) -> AsyncIterator[str]:
@@ -490,17 +537,10 @@ class OllamaGenerator:
                     return
 
                 # Process the streaming response
-                async for line in response.content.iter_lines():
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        if "message" in data and "content" in data["message"]:
-                            yield data["message"]["content"]
-                    except json.JSONDecodeError:
-                        logger.error(f"Failed to parse JSON from stream: {line}")
-                        continue
+                async for chunk in self._iter_ndjson_text(
+                    response, lambda data: (data.get("message") or {}).get("content")
+                ):
+                    yield chunk
         except asyncio.TimeoutError:
             logger.error(
                 f"Timeout during streaming chat generation after {self.timeout}s"
@@ -556,17 +596,10 @@ class OllamaGenerator:
                     return
 
                 # Process the streaming response
-                async for line in response.content.iter_lines():
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        if "response" in data:
-                            yield data["response"]
-                    except json.JSONDecodeError:
-                        logger.error(f"Failed to parse JSON from stream: {line}")
-                        continue
+                async for chunk in self._iter_ndjson_text(
+                    response, lambda data: data.get("response")
+                ):
+                    yield chunk
         except asyncio.TimeoutError:
             logger.error(
                 f"Timeout during streaming completion generation after {self.timeout}s"
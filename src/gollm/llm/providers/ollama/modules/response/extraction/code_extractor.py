@@ -4,8 +4,23 @@ import logging
 import re
 from typing import Tuple, List, Optional
 
+from gollm.validation.validators.markdown_cleaner import strip_fences
+
 logger = logging.getLogger("gollm.ollama.extraction")
 
+# Markdown fence opening a line or ending the text
+_FENCE_DETECT_RE = re.compile(r'```\w*\n|```\w*$')
+
+# Extraction patterns tried in order, from strictest to most lenient
+_EXTRACTION_PATTERNS = [
+    # Pattern 1: Standard markdown code blocks with language specifier and newlines
+    (re.compile(r'```(?:\w*)\n(.+?)(?:\n```|$)', re.DOTALL), "standard"),
+    # Pattern 2: Code blocks without requiring newline after opening backticks
+    (re.compile(r'```(?:\w*)\s*(.+?)(?:\n```|```|$)', re.DOTALL), "flexible"),
+    # Pattern 3: Anything between backticks (most lenient)
+    (re.compile(r'```(.+?)```', re.DOTALL), "lenient"),
+]
+
 
 def extract_code_blocks(text: str) -> str:
     """Extract code blocks from the generated text if present.
@@ -29,46 +44,56 @@ def extract_code_blocks(text: str) -> str:
     # Check if the text is an error JSON
     is_error, error_message = is_error_json(text)
     if is_error:
-        logger.warning(f"Response contains error JSON: {error_message}")
+        logger.warning("Response contains error JSON: %s", error_message)
         return f"ERROR: {error_message}"
     
     # Check if the text already looks like raw code (no markdown)
-    if not re.search(r'```\w*\n|```\w*$', text):
+    if not _FENCE_DETECT_RE.search(text):
         # If it doesn't contain markdown code blocks, return as is
         logger.debug("Text doesn't contain markdown code blocks, returning as is")
         return text
     
-    # Try multiple extraction patterns with detailed logging
-    extraction_patterns = [
-        # Pattern 1: Standard markdown code blocks with language specifier and newlines
-        (r'```(?:\w*)\n(.+?)(?:\n```|$)', "standard"),
-        # Pattern 2: Code blocks without requiring newline after opening backticks
-        (r'```(?:\w*)\s*(.+?)(?:\n```|```|$)', "flexible"),
-        # Pattern 3: Anything between backticks (most lenient)
-        (r'```(.+?)```', "lenient")
-    ]
+    # Fast path: exactly one fenced block needs a single regex match
+    if text.count('```') == 2:
+        extracted_code = strip_fences(text)
+        if extracted_code is not text and extracted_code.strip():
+            logger.info("Extracted single code block, total length: %d", len(extracted_code))
+            return extracted_code
     
-    for pattern, pattern_name in extraction_patterns:
+    # Try multiple extraction patterns with detailed logging
+    for pattern, pattern_name in _EXTRACTION_PATTERNS:
         try:
-            code_blocks = re.findall(pattern, text, re.DOTALL)
+            # A cheap search rules a pattern out before any list is built
+            if not pattern.search(text):
+                logger.debug("%s extraction attempt found no code blocks", pattern_name.title())
+                continue
+            
+            code_blocks = [match.group(1) for match in pattern.finditer(text)]
             
-            logger.debug(f"{pattern_name.title()} extraction attempt found {len(code_blocks)} code blocks")
+            logger.debug(
+                "%s extraction attempt found %d code blocks", pattern_name.title(), len(code_blocks)
+            )
             
             if code_blocks:
-                logger.info(f"Extracted {len(code_blocks)} code blocks with {pattern_name} pattern")
-                for i, block in enumerate(code_blocks):
-                    logger.debug(f"Code block {i+1} length: {len(block)}")
-                    if block:
-                        logger.debug(f"Code block {i+1} preview: {block[:100]}...")
+                logger.info("Extracted %d code blocks with %s pattern", len(code_blocks), pattern_name)
+                # Per-block details are only worth computing when DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, block in enumerate(code_blocks):
+                        logger.debug("Code block %d length: %d", i + 1, len(block))
+                        if block:
+                            logger.debug("Code block %d preview: %.100s...", i + 1, block)
                 
                 extracted_code = '\n\n'.join(code_blocks)
                 if extracted_code and extracted_code.strip():
-                    logger.info(f"Successfully extracted code with {pattern_name} pattern, total length: {len(extracted_code)}")
+                    logger.info(
+                        "Successfully extracted code with %s pattern, total length: %d",
+                        pattern_name, len(extracted_code)
+                    )
                     return extracted_code
                 else:
-                    logger.warning(f"Extraction with {pattern_name} pattern resulted in empty text")
+                    logger.warning("Extraction with %s pattern resulted in empty text", pattern_name)
         except Exception as e:
-            logger.error(f"Error during {pattern_name} code extraction: {str(e)}")
+            logger.error("Error during %s code extraction: %s", pattern_name, e)
     
     # If we still couldn't extract code blocks, return the original text
     logger.debug("No valid code blocks found in response, returning original text")
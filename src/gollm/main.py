@@ -38,6 +38,21 @@ class GollmCore:
         )
         self.log_aggregator = LogAggregator(self.config)
 
+    @classmethod
+    def for_testing(cls, orchestrator) -> "GollmCore":
+        """Tworzy lekką instancję z podanym orkiestratorem, bez I/O konfiguracji.
+
+        Args:
+            orchestrator: Orchestrator (or mock) used for code generation.
+
+        Returns:
+            GollmCore with default in-memory config and the given orchestrator.
+        """
+        core = cls.__new__(cls)
+        core.config = GollmConfig.default()
+        core.llm_orchestrator = orchestrator
+        return core
+
     def validate_file(self, file_path: str) -> dict:
         """Waliduje pojedynczy plik"""
         return self.validator.validate_file(file_path)
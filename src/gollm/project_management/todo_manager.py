@@ -5,7 +5,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -113,6 +113,27 @@ class TodoManager:
         self, violation_type: str, details: Dict[str, Any]
     ) -> Task:
         """Tworzy zadanie na podstawie naruszenia jakości kodu, jeśli nie istnieje już podobne zadanie"""
+        return self.add_tasks_from_violations([(violation_type, details)])[0]
+
+    def add_tasks_from_violations(
+        self, violations: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> List[Task]:
+        """Tworzy zadania z wielu naruszeń naraz i zapisuje plik TODO tylko raz"""
+        tasks = []
+        created = False
+        for violation_type, details in violations:
+            task, is_new = self._task_from_violation(violation_type, details)
+            tasks.append(task)
+            created = created or is_new
+
+        if created:
+            self._save_tasks()
+        return tasks
+
+    def _task_from_violation(
+        self, violation_type: str, details: Dict[str, Any]
+    ) -> Tuple[Task, bool]:
+        """Zwraca istniejące lub nowo dodane zadanie oraz flagę, czy jest nowe"""
         # Sprawdź czy istnieje już podobne zadanie
         file_path = details.get("file_path", "")
         issue_message = details.get("message", "")
@@ -124,7 +145,7 @@ class TodoManager:
                 and violation_type in task.title.lower().replace(" ", "_")
                 and file_path in task.related_files
             ):
-                return task  # Zwróć istniejące zadanie zamiast tworzyć nowe
+                return task, False  # Zwróć istniejące zadanie zamiast tworzyć nowe
 
         # Jeśli nie znaleziono istniejącego zadania, utwórz nowe
         priority_map = {
@@ -175,8 +196,7 @@ class TodoManager:
         )
 
         self.tasks.append(task)
-        self._save_tasks()
-        return task
+        return task, True
 
     def _estimate_effort(self, violation_type: str) -> str:
         """Szacuje czas potrzebny na naprawę"""
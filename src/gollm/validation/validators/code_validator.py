@@ -51,7 +51,24 @@ class CodeValidator:
         try:
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
+        except Exception as e:
+            return self._parse_error_result(e, file_path)
+
+        return self.validate_content(content, file_path)
 
+    def validate_content(
+        self, content: str, file_path: str = "<string>"
+    ) -> Dict[str, Any]:
+        """Validates Python source that is already in memory.
+
+        Args:
+            content: Source code to validate
+            file_path: Path reported in the violations
+
+        Returns:
+            Dictionary with validation results
+        """
+        try:
             violations = []
             violations.extend(self._validate_content(content, file_path))
             violations.extend(self._validate_ast(content, file_path))
@@ -78,16 +95,20 @@ class CodeValidator:
             return result
 
         except Exception as e:
-            return {
-                "violations": [
-                    Violation(
-                        type="parse_error",
-                        message=f"Error parsing file: {str(e)}",
-                        file_path=file_path,
-                        line_number=0,
-                    )
-                ]
-            }
+            return self._parse_error_result(e, file_path)
+
+    def _parse_error_result(self, error: Exception, file_path: str) -> Dict[str, Any]:
+        """Builds the result returned when a file cannot be read or parsed."""
+        return {
+            "violations": [
+                Violation(
+                    type="parse_error",
+                    message=f"Error parsing file: {str(error)}",
+                    file_path=file_path,
+                    line_number=0,
+                )
+            ]
+        }
 
     def validate_project(self, staged_only: bool = False) -> Dict[str, Any]:
         """Validates Python files in the project.
@@ -11,6 +11,29 @@ import traceback
 
 logger = logging.getLogger("gollm.validation.code.escape")
 
+# Escapes understood by the manual fallback; \\ is listed first so an
+# escaped backslash is consumed before the character that follows it
+_ESCAPE_RE = re.compile(r"""\\(?:(\\)|([ntrbf"'])|u([0-9a-fA-F]{4})|x([0-9a-fA-F]{2}))""")
+_SIMPLE_ESCAPES = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+}
+
+
+def _replace_escape(match: re.Match) -> str:
+    """Translate one escape sequence matched by _ESCAPE_RE."""
+    backslash, simple, unicode_hex, byte_hex = match.groups()
+    if backslash:
+        return "\\"
+    if simple:
+        return _SIMPLE_ESCAPES[simple]
+    return chr(int(unicode_hex or byte_hex, 16))
+
 
 def format_code_with_escape_sequences(code: str) -> str:
     """Format code by properly handling escape sequences.
@@ -32,9 +55,13 @@ def format_code_with_escape_sequences(code: str) -> str:
     ):
         logger.info(f"Detected escape sequences in code, attempting to format")
 
-        # Strategy 1: Try codecs.decode with unicode_escape
+        # Strategy 1: Decode every escape form in one unicode_escape pass.
+        # Going through latin-1 with backslashreplace keeps characters such as
+        # 'α' intact (they round-trip as \\uXXXX) instead of failing to encode.
         try:
-            formatted_code = codecs.decode(code, "unicode_escape")
+            formatted_code = codecs.decode(
+                code.encode("latin-1", "backslashreplace"), "unicode_escape"
+            )
             logger.info(f"Successfully formatted code with codecs.decode")
             return formatted_code
         except Exception as e:
@@ -67,41 +94,10 @@ def format_code_with_escape_sequences(code: str) -> str:
                 f"Failed to format with ast.literal_eval (triple quotes): {str(e)}"
             )
 
-        # Strategy 4: Manual replacement of common escape sequences
+        # Strategy 4: Manual replacement of common escape sequences, all in
+        # one regex pass so an earlier replacement can't feed a later one
         try:
-            formatted_code = code
-            replacements = [
-                ("\\n", "\n"),
-                ("\\t", "\t"),
-                ("\\r", "\r"),
-                ('\\"', '"'),
-                ("\\'", "'"),
-                ("\\\\", "\\"),
-                ("\\b", "\b"),
-                ("\\f", "\f"),
-            ]
-            for old, new in replacements:
-                formatted_code = formatted_code.replace(old, new)
-
-            # Handle Unicode escapes (\uXXXX)
-            unicode_pattern = r"\\u([0-9a-fA-F]{4})"
-            while re.search(unicode_pattern, formatted_code):
-                match = re.search(unicode_pattern, formatted_code)
-                if match:
-                    hex_val = match.group(1)
-                    unicode_char = chr(int(hex_val, 16))
-                    formatted_code = formatted_code.replace(
-                        f"\\u{hex_val}", unicode_char
-                    )
-
-            # Handle hex escapes (\xXX)
-            hex_pattern = r"\\x([0-9a-fA-F]{2})"
-            while re.search(hex_pattern, formatted_code):
-                match = re.search(hex_pattern, formatted_code)
-                if match:
-                    hex_val = match.group(1)
-                    hex_char = chr(int(hex_val, 16))
-                    formatted_code = formatted_code.replace(f"\\x{hex_val}", hex_char)
+            formatted_code = _ESCAPE_RE.sub(_replace_escape, code)
 
             logger.info(f"Successfully formatted code with manual replacement")
             return formatted_code
@@ -5,12 +5,31 @@ in generated code and flag them for further completion.
 """
 
 import ast
+import io
 import logging
 import re
-from typing import Dict, List, Tuple, Optional
+import tokenize
+from bisect import bisect_left
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger("gollm.validation.code.incomplete_detector")
 
+# Comment openings (after '#', case-insensitive) that mark placeholder code
+_PLACEHOLDER_KEYWORDS = (
+    "TODO",
+    "FIXME",
+    "XXX",
+    "IMPLEMENT",
+    "NOT IMPLEMENTED",
+    "TO BE IMPLEMENTED",
+    "PLACEHOLDER",
+)
+# Cheap whole-source pre-check; tokenizing is only needed when this matches
+_PLACEHOLDER_RE = re.compile(
+    r"#\s*(?:" + "|".join(_PLACEHOLDER_KEYWORDS) + ")", re.IGNORECASE
+)
+
 
 def contains_incomplete_functions(code: str) -> Tuple[bool, List[Dict[str, str]]]:
     """Check if the code contains incomplete functions.
@@ -31,15 +50,36 @@ def contains_incomplete_functions(code: str) -> Tuple[bool, List[Dict[str, str]]
     if not code or code.isspace():
         return False, []
 
+    # Copies, so callers can't alter what later calls get from the cache
+    incomplete_functions = [dict(func) for func in _analyze(code)]
+    return bool(incomplete_functions), incomplete_functions
+
+
+@lru_cache(maxsize=128)
+def _analyze(code: str) -> Tuple[Dict[str, str], ...]:
+    """Find the incomplete functions in code, memoized per source string.
+    
+    The detect -> format -> extract pipeline looks at the same code more
+    than once per completion round, so parsing and tokenizing happen once.
+    
+    Args:
+        code: The Python code to analyze
+        
+    Returns:
+        The incomplete functions, as described for contains_incomplete_functions
+    """
     # Try to parse with AST to find incomplete functions
     try:
         tree = ast.parse(code)
     except SyntaxError:
         # If code has syntax errors, we can't reliably detect incomplete functions
         logger.warning("Cannot detect incomplete functions due to syntax errors")
-        return False, []
+        return ()
 
     incomplete_functions = []
+    code_lines = code.splitlines()
+    # Tokenized on first need, then shared by every function
+    placeholder_lines = None
 
     for node in ast.walk(tree):
         if isinstance(node, ast.FunctionDef):
@@ -74,8 +114,12 @@ def contains_incomplete_functions(code: str) -> Tuple[bool, List[Dict[str, str]]
                 is_incomplete = True
                 
             # Case 4: Contains TODO/FIXME comments
-            elif _contains_placeholder_comments(code, node):
-                is_incomplete = True
+            else:
+                if placeholder_lines is None:
+                    placeholder_lines = _placeholder_comment_lines(code)
+                is_incomplete = _contains_placeholder_comments(
+                    code, node, placeholder_lines
+                )
                 
             # Get function source code
             if is_incomplete:
@@ -109,7 +153,7 @@ def contains_incomplete_functions(code: str) -> Tuple[bool, List[Dict[str, str]]
                 signature += ":"
                 
                 # Get function source
-                func_lines = code.splitlines()[node.lineno-1:node.end_lineno]
+                func_lines = code_lines[node.lineno-1:node.end_lineno]
                 func_body = "\n".join(func_lines)
                 
                 # Add to incomplete functions list
@@ -123,39 +167,56 @@ def contains_incomplete_functions(code: str) -> Tuple[bool, List[Dict[str, str]]
                 
                 logger.info(f"Found incomplete function: {func_name}")
     
-    return bool(incomplete_functions), incomplete_functions
+    return tuple(incomplete_functions)
 
 
-def _contains_placeholder_comments(code: str, node: ast.FunctionDef) -> bool:
+def _placeholder_comment_lines(code: str) -> List[int]:
+    """Find the lines holding placeholder comments like TODO or FIXME.
+    
+    Uses one tokenize pass, so '#' inside string literals is not mistaken
+    for a comment.
+    
+    Args:
+        code: The full source code
+        
+    Returns:
+        Sorted line numbers of placeholder comments
+    """
+    if not _PLACEHOLDER_RE.search(code):
+        return []
+    
+    lines = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            if token.type == tokenize.COMMENT and (
+                token.string[1:].lstrip().upper().startswith(_PLACEHOLDER_KEYWORDS)
+            ):
+                lines.append(token.start[0])
+    except (tokenize.TokenError, SyntaxError):
+        logger.debug("Could not tokenize code while looking for placeholder comments")
+    return lines
+
+
+def _contains_placeholder_comments(
+    code: str, node: ast.FunctionDef, placeholder_lines: Optional[List[int]] = None
+) -> bool:
     """Check if function contains placeholder comments like TODO or FIXME.
     
     Args:
         code: The full source code
         node: The function definition node
+        placeholder_lines: _placeholder_comment_lines(code), if the caller
+            already has it
         
     Returns:
         True if placeholder comments are found, False otherwise
     """
-    # Get function lines
-    func_lines = code.splitlines()[node.lineno-1:node.end_lineno]
-    func_text = "\n".join(func_lines)
-    
-    # Look for TODO, FIXME, etc. in comments
-    placeholder_patterns = [
-        r'#\s*TODO',
-        r'#\s*FIXME',
-        r'#\s*XXX',
-        r'#\s*IMPLEMENT',
-        r'#\s*NOT IMPLEMENTED',
-        r'#\s*TO BE IMPLEMENTED',
-        r'#\s*PLACEHOLDER',
-    ]
+    if placeholder_lines is None:
+        placeholder_lines = _placeholder_comment_lines(code)
     
-    for pattern in placeholder_patterns:
-        if re.search(pattern, func_text, re.IGNORECASE):
-            return True
-    
-    return False
+    # First placeholder comment at or after the def, if it is inside the body
+    i = bisect_left(placeholder_lines, node.lineno)
+    return i < len(placeholder_lines) and placeholder_lines[i] <= node.end_lineno
 
 
 def format_for_completion(incomplete_functions: List[Dict[str, str]], code: str) -> str:
@@ -179,79 +240,151 @@ def format_for_completion(incomplete_functions: List[Dict[str, str]], code: str)
     
     """
     
-    # Add the original code with TODO markers
-    code_lines = code.splitlines()
-    
-    # Track line offsets due to added comments
-    line_offset = 0
-    
-    # Sort incomplete functions by line number to process them in order
-    sorted_functions = sorted(incomplete_functions, key=lambda f: f["lineno"])
+    # Group TODO markers by the line of the function they precede
+    markers: Dict[int, List[str]] = {}
+    for func in sorted(incomplete_functions, key=lambda f: f["lineno"]):
+        markers.setdefault(func["lineno"], []).append(
+            f"# TODO: Implement the {func['name']} function below"
+        )
     
-    for func in sorted_functions:
-        # Add TODO comment before the function
-        insert_line = func["lineno"] - 1 + line_offset
-        code_lines.insert(insert_line, f"# TODO: Implement the {func['name']} function below")
-        line_offset += 1
+    # Add the original code with TODO markers in a single pass, instead of
+    # inserting into the line list once per function
+    out_lines = []
+    for lineno, line in enumerate(code.splitlines(), start=1):
+        out_lines.extend(markers.pop(lineno, ()))
+        out_lines.append(line)
+    # Markers pointing past the last line still go at the end
+    for lineno in sorted(markers):
+        out_lines.extend(markers[lineno])
     
-    # Join the modified code lines
-    modified_code = "\n".join(code_lines)
-    
-    return prompt + modified_code
+    return prompt + "\n".join(out_lines)
 
 
-def extract_completed_functions(original_code: str, completed_code: str) -> str:
+def extract_completed_functions(
+    original_code: str,
+    completed_code: str,
+    incomplete_functions: Optional[List[Dict[str, str]]] = None,
+) -> str:
     """Extract completed functions from LLM response and merge them with original code.
     
     Args:
         original_code: The original code with incomplete functions
         completed_code: The LLM response with completed functions
+        incomplete_functions: Result of contains_incomplete_functions() for
+            original_code, if the caller already has it
         
     Returns:
         Merged code with completed functions
     """
+    if incomplete_functions is None:
+        _, incomplete_functions = contains_incomplete_functions(original_code)
+    
+    # Nothing to replace, so there is no need to parse the completion
+    if not incomplete_functions:
+        return original_code
+    
     try:
-        # Parse both code versions
-        original_tree = ast.parse(original_code)
         completed_tree = ast.parse(completed_code)
     except SyntaxError:
         logger.error("Syntax error in completed code, cannot merge functions")
         return original_code
     
-    # Extract function definitions from both trees
-    original_funcs = {}
+    # Index the completion's function definitions by name; ast.walk is
+    # breadth-first, so a top-level definition wins over a nested namesake
     completed_funcs = {}
-    
-    for node in ast.walk(original_tree):
-        if isinstance(node, ast.FunctionDef):
-            original_funcs[node.name] = node
-    
     for node in ast.walk(completed_tree):
-        if isinstance(node, ast.FunctionDef):
-            completed_funcs[node.name] = node
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            completed_funcs.setdefault(node.name, node)
     
-    # Replace incomplete functions with completed ones
-    result_code = original_code
-    has_incomplete, incomplete_list = contains_incomplete_functions(original_code)
+    completed_lines = completed_code.splitlines()
+    string_lines = _string_continuation_lines(completed_code)
+    result_lines = original_code.splitlines()
     
-    if has_incomplete:
-        for func_info in incomplete_list:
-            func_name = func_info["name"]
-            if func_name in completed_funcs and func_name in original_funcs:
-                # Get the completed function source
-                completed_node = completed_funcs[func_name]
-                completed_source = ast.unparse(completed_node)
-                
-                # Replace in the original code
-                original_lines = result_code.splitlines()
-                start_line = func_info["lineno"] - 1
-                end_line = func_info["end_lineno"]
-                
-                # Replace the function definition
-                result_code = "\n".join(
-                    original_lines[:start_line] + 
-                    [completed_source] + 
-                    original_lines[end_line:]
-                )
+    # Splice from the bottom up so the line numbers of the functions still
+    # to be replaced stay valid
+    for func_info in sorted(
+        incomplete_functions, key=lambda f: f["lineno"], reverse=True
+    ):
+        completed_node = completed_funcs.get(func_info["name"])
+        if completed_node is None:
+            continue
+        
+        start_line = func_info["lineno"] - 1
+        end_line = func_info["end_lineno"]
+        original_def = result_lines[start_line]
+        indent = original_def[:len(original_def) - len(original_def.lstrip())]
+        
+        result_lines[start_line:end_line] = _reindent_function(
+            completed_lines, completed_node, indent, string_lines
+        )
     
+    result_code = "\n".join(result_lines)
+    if original_code.endswith("\n"):
+        result_code += "\n"
     return result_code
+
+
+def _string_continuation_lines(code: str) -> Set[int]:
+    """Find the lines that continue a multi-line string literal.
+    
+    Their leading whitespace belongs to the string's value, so they must
+    not be re-indented.
+    
+    Args:
+        code: The full source code
+        
+    Returns:
+        Line numbers after the first line of every multi-line string
+    """
+    lines = set()
+    # Python 3.12+ tokenizes f-strings into start/middle/end pieces
+    fstring_start = getattr(tokenize, "FSTRING_START", None)
+    fstring_end = getattr(tokenize, "FSTRING_END", None)
+    open_fstrings = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            if token.type == tokenize.STRING and token.end[0] > token.start[0]:
+                lines.update(range(token.start[0] + 1, token.end[0] + 1))
+            elif fstring_start is not None and token.type == fstring_start:
+                open_fstrings.append(token.start[0])
+            elif fstring_end is not None and token.type == fstring_end:
+                start = open_fstrings.pop()
+                lines.update(range(start + 1, token.end[0] + 1))
+    except (tokenize.TokenError, SyntaxError):
+        logger.debug("Could not tokenize code while looking for multi-line strings")
+    return lines
+
+
+def _reindent_function(
+    lines: List[str],
+    node: ast.AST,
+    indent: str,
+    string_lines: AbstractSet[int] = frozenset(),
+) -> List[str]:
+    """Return a function's source lines moved to a new indentation.
+    
+    The lines are taken verbatim from the completion, so comments in the
+    function body are kept, unlike with ast.unparse.
+    
+    Args:
+        lines: Source lines of the code containing the function
+        node: The function definition node
+        indent: Indentation of the definition being replaced
+        string_lines: Line numbers inside multi-line strings, kept as they are
+        
+    Returns:
+        The function's lines, re-indented
+    """
+    offset = node.col_offset
+    reindented = []
+    for lineno in range(node.lineno, node.end_lineno + 1):
+        line = lines[lineno - 1]
+        if lineno in string_lines:
+            reindented.append(line)
+            continue
+        # Only strip what is whitespace; e.g. a backslash continuation may
+        # be indented less than the def itself
+        prefix = line[:offset]
+        body = line[offset:] if not prefix.strip() else line.lstrip()
+        reindented.append(indent + body if body else body)
+    return reindented
@@ -9,6 +9,10 @@ from typing import Tuple
 
 logger = logging.getLogger("gollm.validation.code.markdown")
 
+# Body of a ```lang fenced block; the opener must end its line so the first
+# code line keeps its indentation
+_FENCE_STRIP_RE = re.compile(r"```[\w+-]*[ \t]*\n(.*?)\n?[ \t]*```", re.DOTALL)
+
 # Common language identifiers that might appear at the start of files
 LANGUAGE_IDENTIFIERS = [
     "python",
@@ -39,6 +43,20 @@ LANGUAGE_IDENTIFIERS = [
 ]
 
 
+def strip_fences(text: str) -> str:
+    """Return the body of the first fenced code block in text.
+
+    Args:
+        text: Text that might contain a markdown code block
+
+    Returns:
+        The code inside the fences, or the original text object if there is
+        no complete fenced block
+    """
+    match = _FENCE_STRIP_RE.search(text)
+    return match.group(1) if match else text
+
+
 def clean_markdown_artifacts(code: str) -> Tuple[str, bool]:
     """Clean markdown artifacts from generated code.
 
@@ -7,8 +7,12 @@ import logging
 import re
 from typing import List
 
+from .markdown_cleaner import strip_fences
+
 logger = logging.getLogger("gollm.validation.code.text")
 
+_CODE_BLOCK_RE = re.compile(r"```(?:\w*)?\n(.+?)\n```", re.DOTALL)
+
 
 def looks_like_prompt(text: str) -> bool:
     """Check if the text looks like a prompt rather than code.
@@ -113,11 +117,15 @@ def extract_code_blocks(text: str) -> List[str]:
     # Look for markdown code blocks
     code_blocks = []
 
+    # A single fenced block (the usual LLM reply) needs just one match
+    if text.count("```") == 2:
+        block = strip_fences(text)
+        if block is not text and block.strip():
+            code_blocks.append(block)
+
     # Pattern for ```language\n...code...\n``` style blocks
-    pattern = r"```(?:\w*)?\n(.+?)\n```"
-    matches = re.findall(pattern, text, re.DOTALL)
-    if matches:
-        code_blocks.extend(matches)
+    if not code_blocks:
+        code_blocks.extend(_CODE_BLOCK_RE.findall(text))
 
     # If no markdown blocks found, check for indented blocks (4+ spaces or tabs)
     if not code_blocks:
@@ -4,6 +4,7 @@ This module coordinates the validation process for different types of code.
 """
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..common import CodeValidationResult
@@ -45,7 +46,33 @@ def validate_and_extract_code(
         Tuple of (is_valid, validated_content, issues)
     """
     options = options or {}
-
+    try:
+        options_key = frozenset(options.items())
+    except TypeError:
+        # Unhashable option values can't be part of a cache key
+        return _validate_and_extract(content, file_extension, options)
+
+    is_valid, validated_content, issues = _validate_and_extract_cached(
+        content, file_extension, options_key
+    )
+    return is_valid, validated_content, list(issues)
+
+
+@lru_cache(maxsize=256)
+def _validate_and_extract_cached(
+    content: str, file_extension: str, options_key: frozenset
+) -> Tuple[bool, str, Tuple[str, ...]]:
+    """Memoized validation; issues are kept as a tuple so callers can't mutate them."""
+    is_valid, validated_content, issues = _validate_and_extract(
+        content, file_extension, dict(options_key)
+    )
+    return is_valid, validated_content, tuple(issues)
+
+
+def _validate_and_extract(
+    content: str, file_extension: str, options: Dict[str, bool]
+) -> Tuple[bool, str, List[str]]:
+    """Uncached body of validate_and_extract_code."""
     # Clean markdown artifacts from the content
     content, was_cleaned = clean_markdown_artifacts(content)
     if was_cleaned:
@@ -2,18 +2,109 @@
 Pytest configuration and shared fixtures for goLLM tests
 """
 
+import hashlib
+import json
+import logging
 import os
 import shutil
 import tempfile
 import time
 from pathlib import Path
-from typing import Generator
+from typing import Any, Awaitable, Callable, Dict, Generator
 
 import pytest
 
+from gollm.config.config import GollmConfig
+
 # Default test configuration
 LLM_MODEL = os.getenv("GOLLM_MODEL", "deepseek-coder:latest")
 LLM_TEST_TIMEOUT = int(os.getenv("GOLLM_TEST_TIMEOUT", "120"))  # seconds
+# Small model for tests that only check substrings; 7B runs are marked slow
+TEST_MODEL = os.getenv("GOLLM_TEST_MODEL", "tinyllama:1.1b")
+# Per-request bounds for real LLM calls; substring assertions need few tokens
+TEST_MAX_TOKENS = 64
+TEST_REQUEST_TIMEOUT = 15  # seconds
+# Tests marked slow run a 7B model, whose cold load alone can exceed the above
+SLOW_TEST_REQUEST_TIMEOUT = 120  # seconds
+# One LLM call per request; no retry loop in real-LLM runs
+TEST_MAX_ITERATIONS = 1
+# Byte-identical prefix for every real-LLM test prompt, so that the server's
+# prompt cache can reuse it; keep it free of timestamps and per-test values
+TEST_SYSTEM_PREFIX = (
+    "You are a Python code generator used by automated tests. "
+    "Always answer with a single, complete, runnable Python module. "
+    "Use standard library only, follow PEP 8, add type hints and short "
+    "docstrings, and do not include explanations outside the code."
+)
+
+
+# Opt-in disk cache for live LLM calls in scripts that exercise a real
+# provider; set GOLLM_TEST_LLM_CACHE=1 to reuse earlier successful replies
+LLM_CACHE_ENABLED = os.getenv("GOLLM_TEST_LLM_CACHE") == "1"
+LLM_CACHE_FILE = Path(
+    os.getenv("GOLLM_TEST_LLM_CACHE_FILE", Path(__file__).parent / ".llm_cache.json")
+)
+_llm_cache = None
+
+
+def _load_llm_cache() -> Dict[str, Any]:
+    """Read the cache file once per process; a missing or corrupt file is empty."""
+    global _llm_cache
+    if _llm_cache is None:
+        try:
+            _llm_cache = json.loads(LLM_CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _llm_cache = {}
+    return _llm_cache
+
+
+async def cached_llm_call(
+    model: str, prompt: str, call: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Return a cached reply for (model, prompt), or await call() and store it.
+
+    Only replies with success set are stored. Without GOLLM_TEST_LLM_CACHE=1
+    this just awaits call().
+
+    Args:
+        model: Model name, part of the cache key
+        prompt: Prompt text, part of the cache key
+        call: Zero-argument coroutine function making the real request
+    """
+    if not LLM_CACHE_ENABLED:
+        return await call()
+
+    key = hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+    cache = _load_llm_cache()
+    if key in cache:
+        return cache[key]
+
+    response = await call()
+    if isinstance(response, dict) and response.get("success"):
+        cache[key] = response
+        LLM_CACHE_FILE.write_text(json.dumps(cache, default=str), encoding="utf-8")
+    return response
+
+
+def with_test_prefix(prompt: str) -> str:
+    """Prepend the shared TEST_SYSTEM_PREFIX to a test prompt."""
+    return f"{TEST_SYSTEM_PREFIX}\n\n{prompt}"
+
+
+def configure_test_logging(**kwargs) -> None:
+    """Configure logging for test scripts at INFO level.
+
+    Set GOLLM_DEBUG=1 to get DEBUG output. aiohttp and asyncio stay at
+    WARNING, since their per-chunk records swamp streamed responses.
+
+    Args:
+        **kwargs: Extra arguments passed to logging.basicConfig
+    """
+    logging.basicConfig(level=logging.INFO, **kwargs)
+    if os.environ.get("GOLLM_DEBUG"):
+        logging.getLogger().setLevel(logging.DEBUG)
+    for name in ("aiohttp", "asyncio"):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 
 def llm_test(timeout: int = LLM_TEST_TIMEOUT):
@@ -39,6 +130,12 @@ def temp_project() -> Generator[Path, None, None]:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def gollm_config() -> GollmConfig:
+    """Default configuration shared by the session; deepcopy it before mutating."""
+    return GollmConfig.default()
+
+
 @pytest.fixture(scope="session")
 def llm_model() -> str:
     """Fixture to get the LLM model to use for tests."""
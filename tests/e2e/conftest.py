@@ -0,0 +1,203 @@
+"""
+Shared fixtures for goLLM end-to-end tests.
+
+By default every e2e test runs against a canned Ollama adapter so no
+inference work is done; set GOLLM_E2E_REAL=1 to talk to a real server.
+
+Real runs can be spread over several workers (``make test-e2e-parallel``).
+Start the server with OLLAMA_NUM_PARALLEL=4 and OLLAMA_KEEP_ALIVE=30m so it
+batches the workers' requests on one warm model instead of queueing them.
+"""
+
+import os
+import re
+import types
+from pathlib import Path
+from typing import Optional, Union
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from gollm.config.config import (GollmConfig, LLMIntegration,
+                                 ProjectManagement, ValidationRules)
+from tests.conftest import (TEST_MAX_ITERATIONS, TEST_MAX_TOKENS, TEST_MODEL,
+                            TEST_REQUEST_TIMEOUT)
+
+E2E_REAL = os.getenv("GOLLM_E2E_REAL") == "1"
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+
+CANNED_CODE = '''import math
+
+
+def factorial(n: int) -> int:
+    """Calculate factorial of a number."""
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    return math.factorial(n)
+'''
+
+# Matches any factorial definition (recursive, iterative or math-based)
+FACTORIAL_DEF_RE = re.compile(r"def\s+factorial\s*\(")
+
+CANNED_RESPONSE = {
+    "success": True,
+    "generated_code": CANNED_CODE,
+    "raw_response": "",
+    "model": TEST_MODEL,
+}
+
+
+async def _canned_generate_code(prompt, context=None):
+    """Return the canned response; answers the health-check ping with 'pong'."""
+    if "pong" in prompt:
+        return {**CANNED_RESPONSE, "generated_code": "pong"}
+    return dict(CANNED_RESPONSE)
+
+
+class _FakeResponse:
+    """Canned GET /api/tags response listing TEST_MODEL."""
+
+    status = 200
+
+    async def json(self):
+        return {"models": [{"name": TEST_MODEL}]}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeClientSession:
+    """Stand-in for aiohttp.ClientSession that answers every GET from memory."""
+
+    def __init__(self, *args, **kwargs):
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        return _FakeResponse()
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+        return False
+
+
+@pytest.fixture(autouse=True)
+def mock_ollama_adapter(mocker):
+    """Replace network calls of the Ollama adapter unless GOLLM_E2E_REAL=1."""
+    if E2E_REAL:
+        return
+    # Sessions opened by gollm.llm.ollama_adapter (e.g. the health check's
+    # GET /api/tags) get canned replies; aiohttp itself stays untouched
+    fake_aiohttp = types.SimpleNamespace(**vars(aiohttp))
+    fake_aiohttp.ClientSession = _FakeClientSession
+    mocker.patch("gollm.llm.ollama_adapter.aiohttp", fake_aiohttp)
+
+    adapter = "gollm.llm.ollama_adapter.OllamaAdapter"
+    mocker.patch(f"{adapter}.generate_code", AsyncMock(side_effect=_canned_generate_code))
+    mocker.patch(f"{adapter}.is_available", AsyncMock(return_value=True))
+    mocker.patch(f"{adapter}.list_models", AsyncMock(return_value=[TEST_MODEL]))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def prewarm_ollama():
+    """Load TEST_MODEL once per session so no test pays the cold-load cost.
+
+    Only runs with GOLLM_E2E_REAL=1. keep_alive keeps the model resident
+    for the rest of the run; failures are ignored and surface in the tests.
+    """
+    if not E2E_REAL:
+        return
+    try:
+        import httpx
+    except ImportError:
+        return
+    try:
+        async with httpx.AsyncClient(
+            base_url=OLLAMA_BASE_URL, timeout=TEST_REQUEST_TIMEOUT * 4
+        ) as client:
+            await client.post(
+                "/api/generate",
+                json={
+                    "model": TEST_MODEL,
+                    "prompt": "x",
+                    "stream": False,
+                    "keep_alive": "30m",
+                    "options": {"num_predict": 1},
+                },
+            )
+    except httpx.HTTPError:
+        pass
+
+
+def make_gollm_config(
+    project_root: Union[str, Path], files_dir: Optional[Union[str, Path]] = None
+) -> GollmConfig:
+    """Build the GollmConfig used by the Ollama e2e tests.
+
+    A fresh config is built on each call, so a test may mutate the result
+    without affecting later tests.
+
+    Args:
+        project_root: Project root for the config
+        files_dir: Directory for TODO.md/CHANGELOG.md (relative names if None)
+    """
+    files_dir = Path(files_dir) if files_dir else None
+    return GollmConfig(
+        project_root=str(project_root),
+        validation_rules=ValidationRules(
+            max_function_lines=50,
+            max_file_lines=1000,
+            max_function_params=5,
+            max_cyclomatic_complexity=10,
+            forbid_print_statements=True,
+            forbid_global_variables=True,
+            require_docstrings=True,
+            naming_convention="snake_case",
+        ),
+        project_management=ProjectManagement(
+            todo_file=str(files_dir / "TODO.md") if files_dir else "TODO.md",
+            changelog_file=(
+                str(files_dir / "CHANGELOG.md") if files_dir else "CHANGELOG.md"
+            ),
+        ),
+        llm_integration=LLMIntegration(
+            model_name=TEST_MODEL,
+            max_iterations=TEST_MAX_ITERATIONS,
+            token_limit=4000,
+            api_provider="ollama",
+            providers={
+                "ollama": {
+                    "base_url": OLLAMA_BASE_URL,
+                    "model": TEST_MODEL,
+                    "temperature": 0.1,
+                    "token_limit": 4000,
+                    "max_tokens": TEST_MAX_TOKENS,
+                    "timeout": TEST_REQUEST_TIMEOUT,
+                    "keep_alive": "30m",
+                }
+            },
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def temp_project_dir(tmp_path_factory) -> Path:
+    """Temporary project directory shared by the whole e2e session.
+
+    The empty TODO.md and CHANGELOG.md files are created once here rather
+    than in every fixture that needs them.
+    """
+    temp_dir = tmp_path_factory.mktemp("gollm_test_")
+    for name in ("TODO.md", "CHANGELOG.md"):
+        (temp_dir / name).write_text(f"# {name}\n\n")
+    return temp_dir
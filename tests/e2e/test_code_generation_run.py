@@ -4,13 +4,24 @@ These tests verify that GoLLM can generate Python code and that the
 generated code can be executed successfully.
 """
 
+import importlib.util
 import os
 import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 from tests.conftest import llm_test
 
+# Environment shared by every subprocess instead of being rebuilt per call
+BASE_ENV = os.environ.copy()
+# Executing generated code needs no startup file, bytecode cache or user site
+EXEC_ENV = {
+    **BASE_ENV,
+    "PYTHONSTARTUP": "",
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTHONNOUSERSITE": "1",
+}
 
 
 class TestCodeGenerationRun(unittest.TestCase):
@@ -28,29 +39,58 @@ class TestCodeGenerationRun(unittest.TestCase):
         os.chdir(self.original_dir)
         self.temp_dir.cleanup()
 
-    def run_gollm_command(self, prompt, test_name):
-        """Run gollm generate command with the given prompt."""
+    def _run(self, args, env, timeout=120):
+        """Run a command once, collecting stdout/stderr via communicate()."""
+        popen_kwargs = {}
+        if sys.version_info >= (3, 11):
+            popen_kwargs["process_group"] = 0
+        with subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=self.test_dir,
+            env=env,
+            start_new_session=False,
+            **popen_kwargs,
+        ) as proc:
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                stdout, stderr = proc.communicate()
+                self.fail(f"Command timed out after {timeout}s: {args}\n{stderr}")
+        return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+    def run_gollm_command(self, prompt, test_name, expected_symbols=None):
+        """Run gollm generate command with the given prompt.
+
+        When ``expected_symbols`` is given, the generated file is imported
+        in-process and the module is returned instead of running it in a
+        separate interpreter.
+        """
         # Create a temporary output file
-        output_file = os.path.join(self.temp_dir, f"output_{test_name}.py")
+        output_file = os.path.join(self.test_dir, f"output_{test_name}.py")
         
         # Run gollm generate with the prompt and -o flag
-        result = subprocess.run(
-            ["gollm", "generate", prompt, "-o", output_file],
-            capture_output=True,
-            text=True,
-            cwd=self.temp_dir
-        )
+        result = self._run(["gollm", "generate", prompt, "-o", output_file], BASE_ENV)
         
         self.assertEqual(result.returncode, 0, f"gollm generate failed: {result.stderr}")
         self.assertTrue(os.path.exists(output_file), f"Output file {output_file} was not created")
         
+        if expected_symbols:
+            spec = importlib.util.spec_from_file_location(f"gen_{test_name}", output_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            for symbol in expected_symbols:
+                self.assertTrue(
+                    hasattr(module, symbol),
+                    f"Generated code does not define '{symbol}':\n{open(output_file).read()}",
+                )
+            return module
+
         # Execute the generated Python code
-        python_result = subprocess.run(
-            ["python", output_file],
-            capture_output=True,
-            text=True,
-            cwd=self.temp_dir
-        )
+        python_result = self._run([sys.executable, output_file], EXEC_ENV)
         
         self.assertEqual(python_result.returncode, 0, f"Python execution failed: {python_result.stderr}\nGenerated code:\n{open(output_file).read()}")
 
@@ -59,9 +99,9 @@ class TestCodeGenerationRun(unittest.TestCase):
     @llm_test(timeout=30)
     def test_simple_function(self):
         """Test generating a simple function that adds two numbers."""
-        prompt = "Create a function that adds two numbers and test it with the values 5 and 7"
-        result = self.run_gollm_command(prompt, "simple_function")
-        self.assertIn("12", result.stdout, "Expected output containing the sum 5+7=12")
+        prompt = "Create a function named add that adds two numbers and test it with the values 5 and 7"
+        module = self.run_gollm_command(prompt, "simple_function", expected_symbols=["add"])
+        self.assertEqual(module.add(5, 7), 12, "Expected the sum 5+7=12")
 
     @llm_test(timeout=30)
     def test_user_class(self):
@@ -73,16 +113,20 @@ class TestCodeGenerationRun(unittest.TestCase):
     @llm_test(timeout=30)
     def test_factorial_recursive(self):
         """Test generating a recursive factorial function."""
-        prompt = "Create a recursive factorial function and test it with the value 5"
-        result = self.run_gollm_command(prompt, "factorial_recursive")
-        self.assertIn("120", result.stdout, "Expected output containing factorial of 5 (120)")
+        prompt = "Create a recursive function named factorial and test it with the value 5"
+        module = self.run_gollm_command(prompt, "factorial_recursive", expected_symbols=["factorial"])
+        self.assertEqual(module.factorial(5), 120, "Expected factorial of 5 (120)")
 
     @llm_test(timeout=30)
     def test_fibonacci_sequence(self):
         """Test generating a function that returns Fibonacci sequence."""
-        prompt = "Create a function that returns the first 10 numbers in the Fibonacci sequence"
-        result = self.run_gollm_command(prompt, "fibonacci_sequence")
-        self.assertIn("0, 1, 1, 2, 3, 5, 8, 13, 21, 34", result.stdout, "Expected output containing Fibonacci sequence")
+        prompt = "Create a function named fibonacci that takes n and returns a list of the first n numbers in the Fibonacci sequence"
+        module = self.run_gollm_command(prompt, "fibonacci_sequence", expected_symbols=["fibonacci"])
+        self.assertEqual(
+            list(module.fibonacci(10)),
+            [0, 1, 1, 2, 3, 5, 8, 13, 21, 34],
+            "Expected the first 10 Fibonacci numbers",
+        )
 
     @llm_test(timeout=30)
     def test_string_manipulation(self):
@@ -1,9 +1,8 @@
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
 
 import pytest
-from tests.conftest import llm_test
+from tests.conftest import TEST_MODEL, llm_test
 
 
 from gollm.llm.direct_api import DirectLLMClient
@@ -15,61 +14,64 @@ class TestDirectAPI:
 
     @pytest.fixture
     def mock_response(self):
-        mock = MagicMock()
-        mock.status = 200
-        mock.json.return_value = {
+        return {
             "model": "codellama:7b",
             "created_at": "2023-11-04T12:34:56Z",
             "response": "def hello_world():\n    print('Hello, World!')\n",
+            "message": {
+                "role": "assistant",
+                "content": "def hello_world():\n    print('Hello, World!')\n",
+            },
             "done": True,
         }
-        return mock
 
     @pytest.fixture
-    def mock_session(self, mock_response):
-        with patch("aiohttp.ClientSession") as mock_session:
-            session_instance = mock_session.return_value
-            session_instance.__aenter__.return_value = session_instance
-            session_instance.__aexit__.return_value = None
-            session_instance.post.return_value.__aenter__.return_value = mock_response
-            yield session_instance
-
-    @pytest.mark.asyncio
-    async def test_generate(self, mock_session):
+    def mock_api(self, mock_response):
+        respx = pytest.importorskip("respx")
+        with respx.mock(
+            base_url="http://localhost:11434", assert_all_called=False
+        ) as router:
+            router.post("/api/generate", name="generate").respond(json=mock_response)
+            router.post("/api/chat", name="chat").respond(json=mock_response)
+            yield router
+
+    async def test_generate(self, mock_api):
         """Test the generate method of DirectLLMClient."""
-        client = DirectLLMClient(api_url="http://localhost:11434")
-        response = await client.generate(
-            prompt="Write a hello world function",
-            model="codellama:7b",
-            temperature=0.7,
-            max_tokens=100,
-        )
+        async with DirectLLMClient(base_url="http://localhost:11434") as client:
+            response = await client.generate(
+                prompt="Write a hello world function",
+                model="codellama:7b",
+                temperature=0.7,
+                max_tokens=100,
+            )
 
-        assert "hello_world" in response
-        assert mock_session.post.called
+        assert "hello_world" in response["response"]
+        assert mock_api["generate"].called
         assert (
-            mock_session.post.call_args[0][0] == "http://localhost:11434/api/generate"
+            str(mock_api["generate"].calls.last.request.url)
+            == "http://localhost:11434/api/generate"
         )
 
-    @pytest.mark.asyncio
-    async def test_chat_completion(self, mock_session):
+    async def test_chat_completion(self, mock_api):
         """Test the chat_completion method of DirectLLMClient."""
-        client = DirectLLMClient(api_url="http://localhost:11434")
-        response = await client.chat_completion(
-            messages=[{"role": "user", "content": "Write a hello world function"}],
-            model="codellama:7b",
-            temperature=0.7,
-            max_tokens=100,
-        )
+        async with DirectLLMClient(base_url="http://localhost:11434") as client:
+            response = await client.chat_completion(
+                messages=[{"role": "user", "content": "Write a hello world function"}],
+                model="codellama:7b",
+                temperature=0.7,
+                max_tokens=100,
+            )
 
-        assert "hello_world" in response
-        assert mock_session.post.called
-        assert mock_session.post.call_args[0][0] == "http://localhost:11434/api/chat"
+        assert "hello_world" in response["message"]["content"]
+        assert mock_api["chat"].called
+        assert (
+            str(mock_api["chat"].calls.last.request.url)
+            == "http://localhost:11434/api/chat"
+        )
 
-    @pytest.mark.asyncio
-    async def test_save_to_file(self, mock_session):
+    async def test_save_to_file(self, mock_api):
         """Test saving the response to a file."""
-        client = DirectLLMClient(api_url="http://localhost:11434")
+        client = DirectLLMClient(base_url="http://localhost:11434")
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             temp_path = temp_file.name
 
@@ -93,14 +95,13 @@ class TestDirectAPI:
 class TestDirectAPIIntegration:
     """Integration tests that require a running Ollama service."""
 
-    @pytest.mark.asyncio
     @pytest.mark.skipif("not os.environ.get('GOLLM_TEST_INTEGRATION')")
     async def test_real_generate(self):
         """Test with a real Ollama service."""
         client = DirectLLMClient(api_url="http://localhost:11434")
         response = await client.generate(
             prompt="Write a simple hello world function in Python",
-            model="codellama:7b",
+            model=TEST_MODEL,
             temperature=0.7,
             max_tokens=100,
         )
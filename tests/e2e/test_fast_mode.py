@@ -1,3 +1,4 @@
+import asyncio
 import os
 from unittest.mock import MagicMock, patch
 
@@ -5,7 +6,9 @@ import pytest
 from tests.conftest import llm_test
 
 
-from gollm.llm.orchestrator import LLMRequest
+from gollm.config.config import GollmConfig
+from gollm.core.session_models import CliContext, GollmSession, SessionState
+from gollm.llm.orchestrator import LLMOrchestrator, LLMRequest
 from gollm.main import GollmCore
 
 
@@ -32,8 +35,7 @@ class TestFastMode:
     @llm_test(timeout=30)
     def test_fast_mode_flag_propagation(self, mock_orchestrator):
         """Test that the fast mode flag is properly propagated to the orchestrator."""
-        core = GollmCore(config_path=None)
-        core._llm_orchestrator = mock_orchestrator
+        core = GollmCore.for_testing(mock_orchestrator)
 
         # Call with fast mode enabled
         core.handle_code_generation(
@@ -54,8 +56,7 @@ class TestFastMode:
     @llm_test(timeout=30)
     def test_fast_mode_uses_single_iteration(self, mock_orchestrator):
         """Test that fast mode uses only a single iteration."""
-        core = GollmCore(config_path=None)
-        core._llm_orchestrator = mock_orchestrator
+        core = GollmCore.for_testing(mock_orchestrator)
 
         # Call with fast mode enabled but iterations > 1
         # The system should override and use only 1 iteration
@@ -73,47 +74,72 @@ class TestFastMode:
         assert call_args.max_iterations == 1
 
 
+def _run_request(core, fast_mode, iterations):
+    """Run one code generation request the way the CLI does."""
+    prompt = "Create a simple function to add two numbers"
+    session = GollmSession(
+        gollm_version="test",
+        original_request=prompt,
+        cli_context=CliContext(request=prompt, fast_mode=fast_mode, iterations=iterations),
+        current_state=SessionState(),
+    )
+    return asyncio.run(
+        core.handle_code_generation_request(
+            session,
+            cli_provided_context={
+                "fast_mode": fast_mode,
+                "max_iterations": 1 if fast_mode else iterations,
+            },
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def warm_core():
+    """GollmCore warmed up with a dummy request so benchmarks exclude setup cost."""
+    core = GollmCore.for_testing(LLMOrchestrator(config=GollmConfig.default()))
+    _run_request(core, fast_mode=True, iterations=1)
+    return core
+
+
+# Mean timings collected per mode, compared once both modes have run
+_MODE_MEANS = {}
+
+
 @pytest.mark.integration
 class TestFastModeIntegration:
     """Integration tests for fast mode that require a running Ollama service."""
 
     @pytest.mark.skipif("not os.environ.get('GOLLM_TEST_INTEGRATION')")
-    def test_fast_mode_performance(self):
+    @pytest.mark.parametrize(
+        "mode,fast_mode,iterations",
+        [("standard", False, 3), ("fast", True, 1)],
+    )
+    def test_fast_mode_performance(
+        self, benchmark, warm_core, mode, fast_mode, iterations
+    ):
         """Test that fast mode is faster than standard mode."""
-        import time
-
-        core = GollmCore(config_path=None)
-
-        # Time the standard mode
-        start_time = time.time()
-        standard_result = core.handle_code_generation(
-            prompt="Create a simple function to add two numbers",
-            output_path=None,
-            critical=False,
-            create_todo=False,
-            fast_mode=False,
-            iterations=3,
+        result = benchmark.pedantic(
+            _run_request,
+            args=(warm_core, fast_mode, iterations),
+            rounds=3,
+            warmup_rounds=1,
         )
-        standard_time = time.time() - start_time
+        if benchmark.stats is not None:  # None under --benchmark-disable
+            _MODE_MEANS[mode] = benchmark.stats["mean"]
 
-        # Time the fast mode
-        start_time = time.time()
-        fast_result = core.handle_code_generation(
-            prompt="Create a simple function to add two numbers",
-            output_path=None,
-            critical=False,
-            create_todo=False,
-            fast_mode=True,
-            iterations=1,
-        )
-        fast_time = time.time() - start_time
+        if mode != "fast":
+            return
 
         # Check that fast mode produced valid code
-        assert fast_result and "code" in fast_result
-        assert len(fast_result["code"]) > 0
+        assert result and result.generated_code
 
         # Check that fast mode was actually faster
         # We expect at least a 30% speed improvement
+        if "standard" not in _MODE_MEANS or "fast" not in _MODE_MEANS:
+            pytest.skip("Both modes must be benchmarked to compare them")
+        standard_time = _MODE_MEANS["standard"]
+        fast_time = _MODE_MEANS["fast"]
         assert (
             fast_time < standard_time * 0.7
         ), f"Fast mode ({fast_time:.2f}s) should be at least 30% faster than standard mode ({standard_time:.2f}s)"
@@ -7,12 +7,11 @@ import sys
 import pytest
 from datetime import datetime
 
-from tests.conftest import llm_test, llm_model
+from tests.conftest import configure_test_logging, llm_test, llm_model
 from gollm.llm.ollama_adapter import OllamaAdapter, OllamaConfig
 
-# Set up logging with timestamps
-logging.basicConfig(
-    level=logging.DEBUG,  # Set to DEBUG for maximum verbosity
+# Set up logging with timestamps (GOLLM_DEBUG=1 for DEBUG)
+configure_test_logging(
     format="%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
     datefmt="%H:%M:%S",
     handlers=[logging.StreamHandler()],
@@ -1,12 +1,13 @@
 import asyncio
-import logging
-from tests.conftest import llm_test
+from tests.conftest import (TEST_MAX_TOKENS, TEST_MODEL, TEST_REQUEST_TIMEOUT,
+                            configure_test_logging, llm_test,
+                            with_test_prefix)
 
 
 from gollm.llm.ollama_adapter import OllamaLLMProvider
 
-# Enable debug logging
-logging.basicConfig(level=logging.DEBUG)
+# INFO by default; GOLLM_DEBUG=1 enables debug logging
+configure_test_logging()
 
 
 async def main():
@@ -14,20 +15,24 @@ async def main():
         print("Testing Ollama provider directly...")
         config = {
             "enabled": True,
-            "model": "codellama:7b",
+            "model": TEST_MODEL,
             "base_url": "http://localhost:11434",
-            "timeout": 300,
+            "timeout": TEST_REQUEST_TIMEOUT,
             "temperature": 0.1,
             "token_limit": 4000,
+            "max_tokens": TEST_MAX_TOKENS,
         }
 
         print("Creating provider...")
         provider = OllamaLLMProvider(config)
 
         print("Generating response...")
-        response = await provider.generate_response(
-            "Create a simple Flask hello world app",
-            context={"project_config": {"validation_rules": {}}},
+        response = await asyncio.wait_for(
+            provider.generate_response(
+                with_test_prefix("Create a simple Flask hello world app"),
+                context={"project_config": {"validation_rules": {}}},
+            ),
+            timeout=TEST_REQUEST_TIMEOUT,
         )
 
         print("\nResponse:", response)
@@ -42,8 +47,12 @@ async def main():
             import os
 
             os.makedirs("test_app", exist_ok=True)
-            with open("test_app/app.py", "w") as f:
-                f.write(response.get("generated_code", ""))
+            # Encoded code written as bytes, without the io text layer; the
+            # buffered writer keeps writing until every byte is out
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open("test_app/app.py", flags, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                f.write(response.get("generated_code", "").encode("utf-8"))
             print("\n✅ Saved to test_app/app.py")
         else:
             print(f"\n❌ Error: {response.get('error', 'Unknown error')}")
@@ -1,32 +1,39 @@
 import asyncio
-import logging
-from tests.conftest import llm_test
+
+import pytest
+from tests.conftest import (SLOW_TEST_REQUEST_TIMEOUT, TEST_MAX_TOKENS,
+                            configure_test_logging, llm_test)
 
 
 from gollm.llm.ollama_adapter import OllamaLLMProvider
 
-# Enable debug logging
-logging.basicConfig(level=logging.DEBUG)
+# INFO by default; GOLLM_DEBUG=1 enables debug logging
+configure_test_logging()
 
 
+@pytest.mark.slow
 async def test_ollama():
     try:
         print("Testing Ollama integration...")
         config = {
             "model": "codellama:7b",
             "base_url": "http://localhost:11434",
-            "timeout": 300,
+            "timeout": SLOW_TEST_REQUEST_TIMEOUT,
             "temperature": 0.1,
             "token_limit": 4000,
+            "max_tokens": TEST_MAX_TOKENS,
         }
 
         print("Creating provider...")
         provider = OllamaLLMProvider(config)
 
         print("Generating response...")
-        response = await provider.generate_response(
-            "Write a simple Flask hello world app",
-            context={"project_config": {"validation_rules": {}}},
+        response = await asyncio.wait_for(
+            provider.generate_response(
+                "Write a simple Flask hello world app",
+                context={"project_config": {"validation_rules": {}}},
+            ),
+            timeout=SLOW_TEST_REQUEST_TIMEOUT,
         )
 
         print("\nResponse:", response)
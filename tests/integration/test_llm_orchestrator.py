@@ -1,65 +1,70 @@
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from gollm.config.config import GollmConfig
 from gollm.llm.orchestrator import LLMOrchestrator, LLMRequest, LLMResponse
 
 
-class TestLLMOrchestrator:
-
-    @pytest.fixture
-    def config(self):
-        """Test configuration"""
-        return GollmConfig.default()
+@pytest.fixture(scope="module")
+def mock_bundle():
+    """Prebuilt dependency mocks, shared by the module and reset per test"""
+    context_builder = Mock()
+    context_builder.build_context = AsyncMock(
+        return_value={
+            "execution_context": {},
+            "todo_context": {},
+            "project_config": {},
+        }
+    )
+
+    prompt_formatter = Mock()
+    prompt_formatter.create_prompt = Mock(return_value="Test prompt")
+
+    # Create a mock code validator with a numeric quality score
+    code_validator = Mock()
+    code_validator.validate_content.return_value = {
+        "violations": [],
+        "quality_score": 95,  # Ensure this is a number, not a Mock
+    }
+
+    # Create a mock response validator
+    response_validator = Mock()
+    response_validator.validate_response = AsyncMock(
+        return_value={
+            "code_extracted": True,
+            "extracted_code": "def test(): pass",
+            "explanation": "Test function generated by mock",
+            "syntax_valid": True,
+            "code_quality": {
+                "quality_score": 90,  # Numeric quality score
+                "violations": [],
+            },
+            "validation_passed": True,
+            "success": True,
+        }
+    )
 
-    @pytest.fixture
-    def orchestrator(self, config):
-        """Test LLMOrchestrator instance with mocked dependencies"""
-        orchestrator = LLMOrchestrator(config)
-
-        # Mock dependencies
-        orchestrator.context_builder = Mock()
-        orchestrator.context_builder.build_context = AsyncMock(
-            return_value={
-                "execution_context": {},
-                "todo_context": {},
-                "project_config": {},
-            }
-        )
+    return SimpleNamespace(
+        context_builder=context_builder,
+        prompt_formatter=prompt_formatter,
+        code_validator=code_validator,
+        response_validator=response_validator,
+    )
 
-        orchestrator.prompt_formatter = Mock()
-        orchestrator.prompt_formatter.create_prompt = Mock(return_value="Test prompt")
 
-        orchestrator.response_validator = Mock()
-        # Create a mock code validator with a numeric quality score
-        mock_code_validator = Mock()
-        mock_code_validator.validate_content.return_value = {
-            "violations": [],
-            "quality_score": 95,  # Ensure this is a number, not a Mock
-        }
+class TestLLMOrchestrator:
 
-        # Create a mock response validator
-        mock_response_validator = Mock()
-        mock_response_validator.validate_response = AsyncMock(
-            return_value={
-                "code_extracted": True,
-                "extracted_code": "def test(): pass",
-                "explanation": "Test function generated by mock",
-                "syntax_valid": True,
-                "code_quality": {
-                    "quality_score": 90,  # Numeric quality score
-                    "violations": [],
-                },
-                "validation_passed": True,
-                "success": True,
-            }
-        )
+    @pytest.fixture
+    def orchestrator(self, gollm_config, mock_bundle):
+        """Test LLMOrchestrator instance with mocked dependencies"""
+        orchestrator = LLMOrchestrator(gollm_config)
 
-        # Apply the mocks to the orchestrator
-        orchestrator.code_validator = mock_code_validator
-        orchestrator.response_validator = mock_response_validator
+        # Apply the mocks to the orchestrator; reset_mock keeps return values
+        for name, mock in vars(mock_bundle).items():
+            mock.reset_mock()
+            setattr(orchestrator, name, mock)
 
         return orchestrator
 
@@ -92,8 +97,7 @@ class TestLLMOrchestrator:
         assert response.iterations_used == 1
         assert response.quality_score == 95
 
-    @pytest.mark.asyncio
-    async def test_handle_code_generation_request(self, orchestrator):
+    async def test_handle_code_generation_request(self, orchestrator, monkeypatch):
         """Test code generation request handling"""
         # Mock the LLM call to return a well-formed response
         mock_llm_response = '''
@@ -112,9 +116,12 @@ This is a test function that returns the string "test".
         # Mock the _simulate_llm_call method
         orchestrator._simulate_llm_call = AsyncMock(return_value=mock_llm_response)
 
-        # Mock the response validator to return a proper validation result
-        orchestrator.response_validator.validate_response = AsyncMock(
-            return_value={
+        # Mock the response validator to return a proper validation result;
+        # monkeypatch restores the shared mocks after the test
+        monkeypatch.setattr(
+            orchestrator.response_validator,
+            "validate_response",
+            AsyncMock(return_value={
                 "code_extracted": True,
                 "extracted_code": 'def test_function():\n    """Test function"""\n    return "test"',
                 "explanation": "This is a test function that returns the string 'test'.",
@@ -125,12 +132,14 @@ This is a test function that returns the string "test".
                 },
                 "validation_passed": True,
                 "success": True,
-            }
+            }),
         )
 
         # Mock the code validator to return a proper validation result
-        orchestrator.code_validator.validate_content = Mock(
-            return_value={"violations": [], "quality_score": 95, "success": True}
+        monkeypatch.setattr(
+            orchestrator.code_validator,
+            "validate_content",
+            Mock(return_value={"violations": [], "quality_score": 95, "success": True}),
         )
 
         # Execute the request
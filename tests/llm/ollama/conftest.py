@@ -0,0 +1,97 @@
+"""Shared helpers for the Ollama provider tests."""
+
+import functools
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+def _stub(name, bases=()):
+    """Create an empty stand-in class."""
+    return type(name, bases or (object,), {})
+
+
+class AsyncIter:
+    """Async iterator over a prebuilt list, for mocking streaming APIs.
+
+    Cheaper than an async generator: each step is a plain next() call
+    with no generator frame to resume.
+    """
+
+    def __init__(self, items):
+        self._it = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_mock_modules():
+    """Build stand-in modules for the OpenAI and Ollama provider packages.
+
+    Cached so every test module that needs the mocks shares one set; treat
+    the returned mapping as read-only.
+
+    Returns:
+        Dict mapping module name to the stub module to put in sys.modules
+    """
+    http_client = _stub('MockOllamaHttpClient')
+
+    mock_openai_provider = types.ModuleType('gollm.llm.providers.openai')
+    mock_openai_provider.OpenAIClient = _stub('MockOpenAIClient')
+    mock_openai_provider.OpenAILlmProvider = _stub('MockOpenAILlmProvider')
+
+    mock_ollama_provider = types.ModuleType('gollm.llm.providers.ollama')
+    mock_ollama_provider.OllamaHttpClient = http_client
+    mock_ollama_provider.OllamaLLMProvider = _stub('OllamaLLMProvider')
+    mock_ollama_provider.OllamaConfig = _stub('OllamaConfig')
+    mock_ollama_provider.OllamaAdapter = _stub('OllamaAdapter')
+
+    mock_http_adapter = types.ModuleType('gollm.llm.providers.ollama.http')
+    mock_http_adapter.OllamaHttpClient = http_client
+    mock_http_adapter.OllamaHttpAdapter = _stub('OllamaHttpAdapter')
+
+    return {
+        'openai': types.ModuleType('openai'),
+        'gollm.llm.providers.openai': mock_openai_provider,
+        'gollm.llm.providers.ollama': mock_ollama_provider,
+        'gollm.llm.providers.ollama.http': mock_http_adapter,
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_provider_modules():
+    """Install the stub modules as fallbacks for the whole session.
+
+    setdefault keeps any real module that is already imported, and teardown
+    removes only the entries this fixture inserted.
+    """
+    inserted = []
+    for name, module in _build_mock_modules().items():
+        if sys.modules.setdefault(name, module) is module:
+            inserted.append(name)
+    yield
+    for name in inserted:
+        sys.modules.pop(name, None)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Put every Ollama test in one xdist group.
+
+    With --dist loadgroup the group runs on a single worker, so the tests
+    keep sharing the session fixtures above instead of rebuilding them on
+    every worker. The hook sees the whole session, hence the path filter.
+    """
+    here = Path(__file__).parent
+    group = pytest.mark.xdist_group("ollama")
+    for item in items:
+        if here in item.path.parents:
+            item.add_marker(group)
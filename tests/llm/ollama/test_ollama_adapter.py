@@ -5,70 +5,89 @@ These tests verify the functionality of the Ollama adapter and its components,
 including model management, text generation, and error handling.
 """
 
-"""
-Tests for the Ollama adapter implementation.
-
-These tests verify the functionality of the Ollama adapter and its components,
-including model management, text generation, and error handling.
-"""
-
-"""
-Tests for the Ollama adapter implementation.
-
-These tests verify the functionality of the Ollama adapter and its components,
-including model management, text generation, and error handling.
-"""
-
 import asyncio
-import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from dataclasses import asdict
-from unittest.mock import AsyncMock, MagicMock, patch, ANY, call
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from aiohttp import ClientError, ClientResponseError, ClientSession
+from aiohttp import ClientError
+
+# Log files are written by QueueListener threads so logger calls in the
+# tests never block on disk. The log_listeners fixture attaches the queue
+# handlers only while the listeners run, so nothing queues up after teardown
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+_debug_queue = queue.SimpleQueue()
+_debug_handler = logging.handlers.QueueHandler(_debug_queue)
+_debug_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_execution_queue = queue.SimpleQueue()
+_execution_handler = logging.handlers.QueueHandler(_execution_queue)
+_execution_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+# WARNING by default; set GOLLM_TEST_LOGLEVEL=DEBUG for detailed logs
+LOG_LEVEL = os.environ.get("GOLLM_TEST_LOGLEVEL", "WARNING").upper()
 
-# Set up detailed logging for debugging
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('test_ollama_debug.log', mode='w')
-    ]
+    level=LOG_LEVEL,
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler()]
 )
 logger = logging.getLogger('test_ollama_adapter')
-logger.setLevel(logging.DEBUG)
+logger.setLevel(LOG_LEVEL)
 
 # Log all test execution to a separate file
-file_handler = logging.FileHandler('test_ollama_execution.log', mode='w')
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 execution_logger = logging.getLogger('test_execution')
-execution_logger.addHandler(file_handler)
-execution_logger.setLevel(logging.DEBUG)
+execution_logger.setLevel(LOG_LEVEL)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def log_listeners():
+    """Drain the log queues into their files; stopping flushes what is left."""
+    listeners = [
+        logging.handlers.QueueListener(
+            _debug_queue, logging.FileHandler('test_ollama_debug.log', mode='w')
+        ),
+        logging.handlers.QueueListener(
+            _execution_queue, logging.FileHandler('test_ollama_execution.log', mode='w')
+        ),
+    ]
+    for listener in listeners:
+        listener.start()
+    logging.getLogger().addHandler(_debug_handler)
+    execution_logger.addHandler(_execution_handler)
+    yield
+    logging.getLogger().removeHandler(_debug_handler)
+    execution_logger.removeHandler(_execution_handler)
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
 # Add function to log test execution
 def log_test_start(test_name):
-    execution_logger.info(f"\n{'='*80}")
-    execution_logger.info(f"STARTING TEST: {test_name}")
-    execution_logger.info(f"{'='*80}")
+    execution_logger.info("\n" + "=" * 80)
+    execution_logger.info("STARTING TEST: %s", test_name)
+    execution_logger.info("=" * 80)
 
 def log_test_step(step):
-    execution_logger.info(f"\nSTEP: {step}")
+    execution_logger.info("\nSTEP: %s", step)
     execution_logger.info("-" * 60)
 
-# Log environment variables for debugging
-logger.debug("Environment variables:")
-for k, v in os.environ.items():
-    if 'OLLAMA' in k or 'GOLLM' in k or 'PYTHON' in k:
-        logger.debug(f"  {k} = {v}")
+if logger.isEnabledFor(logging.DEBUG):
+    # Log environment variables for debugging
+    logger.debug("Environment variables:")
+    for k, v in os.environ.items():
+        if 'OLLAMA' in k or 'GOLLM' in k or 'PYTHON' in k:
+            logger.debug("  %s = %s", k, v)
 
-# Log Python path for debugging
-logger.debug("Python path:")
-for path in sys.path:
-    logger.debug(f"  {path}")
+    # Log Python path for debugging
+    logger.debug("Python path:")
+    for path in sys.path:
+        logger.debug("  %s", path)
 
 from gollm.llm.ollama import (
     OllamaAdapter,
@@ -76,26 +95,42 @@ from gollm.llm.ollama import (
     OllamaLLMProvider,
     ModelManager
 )
-from gollm.llm.ollama.api.client import OllamaAPIClient
-from gollm.exceptions import (
-    ModelNotFoundError,
-    ModelOperationError,
-    ConfigurationError,
-    ValidationError
-)
+from gollm.exceptions import ModelNotFoundError, ModelOperationError
+from tests.llm.ollama.conftest import AsyncIter
 
 # Test data
 TEST_MODEL = "test-model:latest"
 TEST_PROMPT = "Hello, how are you?"
-TEST_RESPONSE = {"response": "I'm doing well, thank you!", "done": True}
-TEST_CHAT_MESSAGES = [
+# Shared by every test as mock return values and inputs, so keep them
+# read-only; chat() requires real dicts, so callers copy the messages
+TEST_RESPONSE = MappingProxyType({"response": "I'm doing well, thank you!", "done": True})
+TEST_CHAT_MESSAGES = tuple(MappingProxyType(m) for m in (
     {"role": "user", "content": "Hello!"},
     {"role": "assistant", "content": "Hi there!"},
     {"role": "user", "content": "How are you?"}
-]
+))
+_MINIMAL_CONFIG = {"base_url": "http://test:11434", "model": TEST_MODEL}
+TEST_CHAT_RESPONSE = MappingProxyType({"message": {"role": "assistant", "content": "I'm doing well!"}})
 
+# Prebuilt API method mocks, assigned by the tests that need them and reset
+# after every test by reset_shared_mocks
+_GEN_OK = AsyncMock(return_value=TEST_RESPONSE)
+_CHAT_OK = AsyncMock(return_value=TEST_CHAT_RESPONSE)
+_GEN_ERR_CLIENT = AsyncMock(side_effect=ClientError("API error"))
+_GEN_ERR_NOT_FOUND = AsyncMock(side_effect=ModelNotFoundError("Model not found"))
+_GEN_ERR = AsyncMock(side_effect=Exception("Generation failed"))
+_SHARED_MOCKS = (_GEN_OK, _CHAT_OK, _GEN_ERR_CLIENT, _GEN_ERR_NOT_FOUND, _GEN_ERR)
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def reset_shared_mocks():
+    """Clear call records on the prebuilt mocks after each test."""
+    yield
+    for mock in _SHARED_MOCKS:
+        mock.reset_mock()
+
+
+@pytest.fixture(scope="session")
 def mock_config():
     """Create a mock Ollama config for testing."""
     logger.debug("Creating mock OllamaConfig...")
@@ -110,101 +145,95 @@ def mock_config():
         repeat_penalty=1.1,
         stop=[],
     )
-    logger.debug(f"Created OllamaConfig: {config}")
+    logger.debug("Created OllamaConfig: %s", config)
     return config
 
 
-@pytest.fixture
-def mock_api_client():
-    """Create a mock API client for testing."""
+@pytest.fixture(scope="session")
+def mock_config_dict(mock_config):
+    """Serialized mock_config, computed once; treat as read-only."""
+    return mock_config.to_dict()
+
+
+@pytest.fixture(scope="session")
+def _api_client_mocks():
+    """Build the mock API client and its wired methods once per session."""
     logger.debug("Creating mock API client...")
     
-    # Create a mock with the correct spec
-    client = AsyncMock(spec=OllamaAPIClient)
-    
-    # Set up mock methods with debug logging
-    async def mock_generate(*args, **kwargs):
-        logger.debug(f"mock_generate called with args: {args}, kwargs: {kwargs}")
-        return TEST_RESPONSE
-        
-    async def mock_chat(*args, **kwargs):
-        logger.debug(f"mock_chat called with args: {args}, kwargs: {kwargs}")
-        return {"message": {"content": "I'm doing well, thank you!"}}
-        
-    async def mock_health(*args, **kwargs):
-        logger.debug("mock_health called")
-        return {"status": "ok"}
-        
-    async def mock_get_models(*args, **kwargs):
-        logger.debug("mock_get_models called")
-        return {"models": [{"name": TEST_MODEL, "size": 1000}]}
-        
-    async def mock_pull_model(*args, **kwargs):
-        logger.debug(f"mock_pull_model called with args: {args}, kwargs: {kwargs}")
-        return {"status": "success"}
-        
-    async def mock_delete_model(*args, **kwargs):
-        logger.debug(f"mock_delete_model called with args: {args}, kwargs: {kwargs}")
-        return {"status": "success"}
-    
-    # Assign the mock methods
-    client.generate = AsyncMock(side_effect=mock_generate)
-    client.chat = AsyncMock(side_effect=mock_chat)
-    client.health = AsyncMock(side_effect=mock_health)
-    client.get_models = AsyncMock(side_effect=mock_get_models)
-    client.pull_model = AsyncMock(side_effect=mock_pull_model)
-    client.delete_model = AsyncMock(side_effect=mock_delete_model)
-    
-    # Mock the context manager methods
-    async def aenter(*args, **kwargs):
-        logger.debug("Client context entered")
-        return client
-        
-    async def aexit(*args, **kwargs):
-        logger.debug("Client context exited")
-        return None
-        
-    client.__aenter__ = aenter
-    client.__aexit__ = aexit
+    # A plain namespace of AsyncMocks: cheaper than a spec'd mock, and a
+    # misspelled method still fails with AttributeError
+    client = SimpleNamespace(
+        base_url="http://localhost:11434",
+        timeout=30,
+        headers={},
+        session=AsyncMock(),
+        generate=AsyncMock(return_value=TEST_RESPONSE),
+        chat=AsyncMock(return_value={"message": {"content": "I'm doing well, thank you!"}}),
+        health=AsyncMock(return_value={"status": "ok"}),
+        get_models=AsyncMock(return_value={"models": [{"name": TEST_MODEL, "size": 1000}]}),
+        pull_model=AsyncMock(return_value={"status": "success"}),
+        delete_model=AsyncMock(return_value={"status": "success"}),
+        request=AsyncMock(),
+        close=AsyncMock(),
+    )
     
     logger.debug("Mock API client created")
+    methods = {
+        name: value for name, value in vars(client).items()
+        if isinstance(value, AsyncMock)
+    }
+    return client, methods
+
+
+@pytest.fixture
+def mock_api_client(_api_client_mocks):
+    """Provide the shared mock API client, reset to its initial wiring."""
+    client, methods = _api_client_mocks
+    # Tests may replace methods on the client; put the originals back
+    for name, method in methods.items():
+        setattr(client, name, method)
+        method.reset_mock()
     return client
 
 
 @pytest.fixture
-async def mock_adapter(mock_api_client, mock_config):
-    """Create a mock OllamaAdapter with a mock API client."""
+def mock_adapter(mock_api_client, mock_config, mock_config_dict):
+    """Create a mock OllamaAdapter with a mock API client.
+
+    The adapter is marked initialized directly instead of going through
+    initialize()/close(), since every dependency is already mocked.
+    """
     logger.debug("Creating mock adapter...")
     
     # Log the creation of dependencies
-    logger.debug(f"Creating ModelManager with mock_api_client: {mock_api_client}")
+    logger.debug("Creating ModelManager with mock_api_client: %s", mock_api_client)
     
     try:
         # Create a real ModelManager instance with the mock API client
         model_manager = ModelManager(api_client=mock_api_client)
-        logger.debug(f"Created ModelManager: {model_manager}")
+        logger.debug("Created ModelManager: %s", model_manager)
         
         # Create the adapter with the real ModelManager
-        logger.debug(f"Creating OllamaAdapter with config: {mock_config}")
+        logger.debug("Creating OllamaAdapter with config: %s", mock_config)
         adapter = OllamaAdapter(config=mock_config)
         
         # Log the initial state
-        logger.debug(f"Initial adapter state - api_client: {adapter.api_client}, model_manager: {adapter.model_manager}")
+        logger.debug("Initial adapter state - api_client: %s, model_manager: %s", adapter.api_client, adapter.model_manager)
         
         # Set the mock API client and model manager directly
         adapter.api_client = mock_api_client
         adapter.model_manager = model_manager
         adapter._initialized = True  # Mark as initialized
         
-        logger.debug(f"Updated adapter state - api_client: {adapter.api_client}, model_manager: {adapter.model_manager}")
+        logger.debug("Updated adapter state - api_client: %s, model_manager: %s", adapter.api_client, adapter.model_manager)
         
         # Mock the ensure_model method
         async def mock_ensure_model(model_name):
-            logger.debug(f"[MOCK] ensure_model called with model: {model_name}")
+            logger.debug("[MOCK] ensure_model called with model: %s", model_name)
             if not hasattr(mock_ensure_model, 'call_count'):
                 mock_ensure_model.call_count = 0
             mock_ensure_model.call_count += 1
-            logger.debug(f"[MOCK] ensure_model call #{mock_ensure_model.call_count} for model: {model_name}")
+            logger.debug("[MOCK] ensure_model call #%s for model: %s", mock_ensure_model.call_count, model_name)
             return True
         
         adapter.ensure_model = mock_ensure_model
@@ -216,58 +245,53 @@ async def mock_adapter(mock_api_client, mock_config):
                 "status": "healthy",
                 "service_available": True,
                 "model_available": True,
-                "config": mock_config.to_dict()
+                "config": mock_config_dict
             }
         
         adapter.health_check = mock_health_check
         
-        # Add debug method to inspect adapter state
+        # Add debug method to inspect adapter state; the fixture sets every
+        # attribute read here, so no reflection is needed
         def debug_info():
-            config_dict = None
-            if hasattr(adapter, 'config'):
-                if hasattr(adapter.config, 'to_dict'):
-                    config_dict = adapter.config.to_dict()
-                elif hasattr(adapter.config, '__dict__'):
-                    config_dict = vars(adapter.config)
-                else:
-                    config_dict = str(adapter.config)
-            
             return {
-                'initialized': getattr(adapter, '_initialized', None),
-                'config': config_dict,
+                'initialized': adapter._initialized,
+                'config': mock_config_dict,
                 'has_api_client': adapter.api_client is not None,
                 'has_model_manager': adapter.model_manager is not None,
-                'model_manager_type': type(adapter.model_manager).__name__ if hasattr(adapter, 'model_manager') and adapter.model_manager is not None else None
+                'model_manager_type': type(adapter.model_manager).__name__,
             }
         
         adapter.debug_info = debug_info
         
-        logger.debug(f"Mock adapter created successfully. Debug info: {debug_info()}")
-        return adapter
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mock adapter created successfully. Debug info: %s", debug_info())
         
     except Exception as e:
-        logger.error(f"Error creating mock adapter: {str(e)}", exc_info=True)
+        logger.error("Error creating mock adapter: %s", e, exc_info=True)
         raise
-    # Clean up resources
-    if hasattr(adapter, 'close'):
-        await adapter.close()
-    logger.debug("Adapter cleaned up")
+    
+    yield adapter
+    
+    adapter._initialized = False
 
 
-@pytest.fixture
-def mock_session():
-    """Create a mock aiohttp ClientSession."""
-    with patch('aiohttp.ClientSession') as mock:
-        yield mock
+@pytest.fixture(scope="module", autouse=True)
+def _patches():
+    """Patch the provider's adapter class once for the whole module.
+
+    Tests construct adapters from the gollm.llm.ollama import directly, so
+    only OllamaLLMProvider.initialize() sees the replacement.
+    """
+    with patch('gollm.llm.ollama.provider.OllamaAdapter', return_value=AsyncMock()) as adapter:
+        yield SimpleNamespace(adapter=adapter)
 
 
-@pytest.mark.asyncio
 async def test_adapter_initialization(mock_config):
     """Test that the adapter initializes correctly."""
     logger.info("Starting test_adapter_initialization")
     
     adapter = OllamaAdapter(config=mock_config)
-    logger.debug(f"Created adapter with config: {mock_config}")
+    logger.debug("Created adapter with config: %s", mock_config)
     
     assert adapter.config == mock_config
     assert not adapter._initialized
@@ -284,13 +308,12 @@ async def test_adapter_initialization(mock_config):
     logger.info("test_adapter_initialization completed successfully")
 
 
-@pytest.mark.asyncio
 async def test_adapter_generate(mock_adapter):
     """Test text generation with the adapter."""
     logger.info("Starting test_adapter_generate")
     
     # Mock the API client
-    mock_adapter.api_client.generate = AsyncMock(return_value=TEST_RESPONSE)
+    mock_adapter.api_client.generate = _GEN_OK
     
     # Test generation
     result = await mock_adapter.generate(
@@ -310,34 +333,32 @@ async def test_adapter_generate(mock_adapter):
     logger.info("test_adapter_generate completed successfully")
 
 
-@pytest.mark.asyncio
 async def test_adapter_chat(mock_adapter):
     """Test chat completion with the adapter."""
     logger.info("Starting test_adapter_chat")
     
     # Mock the API client
-    mock_response = {"message": {"role": "assistant", "content": "I'm doing well!"}}
-    mock_adapter.api_client.chat = AsyncMock(return_value=mock_response)
+    mock_adapter.api_client.chat = _CHAT_OK
     
     # Test chat
+    messages = [dict(m) for m in TEST_CHAT_MESSAGES]
     result = await mock_adapter.chat(
-        messages=TEST_CHAT_MESSAGES,
+        messages=messages,
         model=TEST_MODEL
     )
     
     # Verify the result
-    assert result == mock_response
+    assert result == TEST_CHAT_RESPONSE
     mock_adapter.api_client.chat.assert_awaited_once()
     
     # Verify parameters
     args, kwargs = mock_adapter.api_client.chat.await_args
-    assert kwargs['messages'] == TEST_CHAT_MESSAGES
+    assert kwargs['messages'] == messages
     assert kwargs['model'] == TEST_MODEL
     
     logger.info("test_adapter_chat completed successfully")
 
 
-@pytest.mark.asyncio
 async def test_adapter_stream_generate(mock_adapter):
     """Test streaming text generation with the adapter."""
     log_test_start("test_adapter_stream_generate")
@@ -351,37 +372,10 @@ async def test_adapter_stream_generate(mock_adapter):
             {"response": " well!", "done": True}
         ]
         
-        # Create a proper async iterable class for our mock chunks
-        class AsyncChunkIterator:
-            def __init__(self, chunks):
-                self.chunks = chunks
-                self.index = 0
-            
-            def __aiter__(self):
-                logger.debug("[ASYNC_ITERATOR] __aiter__ called")
-                return self
-            
-            async def __anext__(self):
-                logger.debug(f"[ASYNC_ITERATOR] __anext__ called, index={self.index}")
-                if self.index >= len(self.chunks):
-                    logger.debug("[ASYNC_ITERATOR] Raising StopAsyncIteration")
-                    raise StopAsyncIteration
-                chunk = self.chunks[self.index]
-                self.index += 1
-                logger.debug(f"[ASYNC_ITERATOR] Yielding chunk: {chunk}")
-                return chunk
-        
-        # Create an instance of our async iterator
-        logger.debug("Creating async iterator instance")
-        
-        # Create an async function that returns our async iterator
-        async def mock_generate_impl(*args, **kwargs):
-            logger.debug("[MOCK_GENERATE] Called with args: %s, kwargs: %s", args, kwargs)
-            return AsyncChunkIterator(mock_chunks)
-        
         # Create a mock for the generate method
         logger.debug("Creating mock for generate method")
-        mock_generate = AsyncMock(side_effect=mock_generate_impl)
+        # generate is awaited once, so return the async iterator directly
+        mock_generate = AsyncMock(return_value=AsyncIter(mock_chunks))
         
         # Create a mock for the API client
         logger.debug("Creating mock API client")
@@ -393,10 +387,10 @@ async def test_adapter_stream_generate(mock_adapter):
         mock_adapter.api_client = mock_api_client
         
         # Debug the setup
-        logger.debug(f"Mock generate type: {type(mock_generate).__name__}")
-        logger.debug(f"Mock generate is coroutine: {asyncio.iscoroutinefunction(mock_generate)}")
-        logger.debug(f"API client type: {type(mock_adapter.api_client).__name__}")
-        logger.debug(f"API client generate type: {type(mock_adapter.api_client.generate).__name__}")
+        logger.debug("Mock generate type: %s", type(mock_generate).__name__)
+        logger.debug("Mock generate is coroutine: %s", asyncio.iscoroutinefunction(mock_generate))
+        logger.debug("API client type: %s", type(mock_adapter.api_client).__name__)
+        logger.debug("API client generate type: %s", type(mock_adapter.api_client.generate).__name__)
         
         # Call the method under test
         log_test_step("Calling stream_generate")
@@ -411,17 +405,17 @@ async def test_adapter_stream_generate(mock_adapter):
                 temperature=0.7,
                 max_tokens=100
             ):
-                logger.debug(f"[TEST] Received chunk: {chunk}")
+                logger.debug("[TEST] Received chunk: %s", chunk)
                 chunks.append(chunk)
-            logger.debug(f"[TEST] Finished collecting {len(chunks)} chunks")
+            logger.debug("[TEST] Finished collecting %s chunks", len(chunks))
         except Exception as e:
-            logger.error(f"[TEST] Error in async for loop: {str(e)}", exc_info=True)
-            logger.error(f"[TEST] Chunks collected so far: {chunks}")
+            logger.error("[TEST] Error in async for loop: %s", e, exc_info=True)
+            logger.error("[TEST] Chunks collected so far: %s", chunks)
             raise
         
         # Verify the results
         log_test_step("Verifying results")
-        logger.debug(f"Collected {len(chunks)} chunks: {chunks}")
+        logger.debug("Collected %s chunks: %s", len(chunks), chunks)
         
         assert len(chunks) == 3, f"Expected 3 chunks, got {len(chunks)}: {chunks}"
         assert chunks[0]["response"] == "I'm", f"Unexpected first chunk: {chunks[0]}"
@@ -434,7 +428,7 @@ async def test_adapter_stream_generate(mock_adapter):
         
         # Get the call arguments
         call_args = mock_generate.await_args[1]
-        logger.debug(f"API call args: {call_args}")
+        logger.debug("API call args: %s", call_args)
         
         # Verify the call arguments
         assert call_args["prompt"] == TEST_PROMPT
@@ -446,16 +440,15 @@ async def test_adapter_stream_generate(mock_adapter):
         logger.info("test_adapter_stream_generate completed successfully")
         
     except Exception as e:
-        logger.error(f"Error in test_adapter_stream_generate: {str(e)}", exc_info=True)
+        logger.error("Error in test_adapter_stream_generate: %s", e, exc_info=True)
         # Log the mock state for debugging
         if 'mock_generate' in locals():
-            logger.error(f"Mock generate call count: {mock_generate.await_count}")
+            logger.error("Mock generate call count: %s", mock_generate.await_count)
             if mock_generate.await_args:
-                logger.error(f"Mock generate call args: {mock_generate.await_args}")
+                logger.error("Mock generate call args: %s", mock_generate.await_args)
         raise
 
 
-@pytest.mark.asyncio
 async def test_adapter_health_check(mock_adapter, mock_api_client):
     """Test health check functionality."""
     log_test_start("test_adapter_health_check")
@@ -464,11 +457,12 @@ async def test_adapter_health_check(mock_adapter, mock_api_client):
     try:
         # Log initial state
         log_test_step("Initial setup")
-        logger.debug(f"Initial adapter state: {getattr(mock_adapter, 'debug_info', lambda: 'No debug_info')()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initial adapter state: %s", mock_adapter.debug_info())
         
         # Mock the API client responses
         mock_models_response = {"models": [{"name": TEST_MODEL}]}
-        logger.debug(f"Mocking get_models to return: {mock_models_response}")
+        logger.debug("Mocking get_models to return: %s", mock_models_response)
         
         # Mock model info response
         model_info = {
@@ -481,7 +475,7 @@ async def test_adapter_health_check(mock_adapter, mock_api_client):
             }
         }
         
-        logger.debug(f"Mocking model_manager.get_model_info to return: {model_info}")
+        logger.debug("Mocking model_manager.get_model_info to return: %s", model_info)
         
         # Ensure model_manager is properly set up
         if not hasattr(mock_adapter, 'model_manager') or mock_adapter.model_manager is None:
@@ -498,13 +492,13 @@ async def test_adapter_health_check(mock_adapter, mock_api_client):
         # Mock health check response
         health_check_response = {"status": "ok"}
         mock_adapter.api_client.health = AsyncMock(return_value=health_check_response)
-        logger.debug(f"Mocked health check response: {health_check_response}")
+        logger.debug("Mocked health check response: %s", health_check_response)
         
         # Perform health check
         log_test_step("Performing health check")
         logger.debug("Calling health_check()...")
         health = await mock_adapter.health_check()
-        logger.debug(f"Health check result: {health}")
+        logger.debug("Health check result: %s", health)
         
         # Verify the result
         log_test_step("Verifying results")
@@ -522,28 +516,6 @@ async def test_adapter_health_check(mock_adapter, mock_api_client):
         assert health["service_available"] is True, "Service should be available"
         assert health["model_available"] is True, f"Model {TEST_MODEL} should be available"
         
-        # Verify config in response
-        assert "config" in health, "Config missing from health check response"
-        assert health["config"]["model"] == TEST_MODEL, \
-            f"Expected model {TEST_MODEL} in config, got {health['config'].get('model')}"
-        
-        # Verify the health check response structure and values
-        log_test_step("Verifying health check response")
-        logger.debug(f"Verifying health check response structure: {health}")
-        
-        # Verify the health check response has the expected structure
-        assert isinstance(health, dict), f"Expected health to be a dict, got {type(health)}"
-        
-        # Check required fields
-        required_fields = ["status", "service_available", "model_available", "config"]
-        for field in required_fields:
-            assert field in health, f"Missing required field in health check: {field}"
-        
-        # Verify values
-        assert health["status"] == "healthy", f"Expected status 'healthy', got {health['status']}"
-        assert health["service_available"] is True, "Service should be available"
-        assert health["model_available"] is True, f"Model {TEST_MODEL} should be available"
-        
         # Verify config in response
         assert "config" in health, "Config missing from health check response"
         assert health["config"]["model"] == TEST_MODEL, \
@@ -552,35 +524,32 @@ async def test_adapter_health_check(mock_adapter, mock_api_client):
         logger.info("test_adapter_health_check completed successfully")
         
     except Exception as e:
-        logger.error(f"Error in test_adapter_health_check: {str(e)}", exc_info=True)
+        logger.error("Error in test_adapter_health_check: %s", e, exc_info=True)
         # Log the full adapter state for debugging
-        if hasattr(mock_adapter, 'debug_info'):
-            logger.error(f"Adapter debug info: {mock_adapter.debug_info()}")
+        logger.error("Adapter debug info: %s", mock_adapter.debug_info())
         raise
 
 
-@pytest.mark.asyncio
-async def test_provider_initialization(mock_config):
+async def test_provider_initialization(mock_config_dict, _patches):
     """Test that the provider initializes correctly."""
     logger.info("Starting test_provider_initialization")
     
-    provider = OllamaLLMProvider(config=mock_config.to_dict())
-    logger.debug(f"Created provider with config: {mock_config}")
+    provider = OllamaLLMProvider(config=mock_config_dict)
+    logger.debug("Created provider with config: %s", mock_config_dict)
     
     assert not provider.is_initialized
     
-    # Mock the adapter
-    mock_adapter = AsyncMock()
-    with patch('gollm.llm.ollama.provider.OllamaAdapter', return_value=mock_adapter):
-        await provider.initialize()
-        logger.debug("Provider initialized")
-        assert provider.is_initialized
-        
-        # Test context manager
-        async with provider as p:
-            logger.debug("Entering provider context...")
-            assert p == provider
-            assert p.is_initialized
+    # The adapter class is patched module-wide by _patches
+    await provider.initialize()
+    logger.debug("Provider initialized")
+    assert provider.is_initialized
+    assert provider._adapter is _patches.adapter.return_value
+    
+    # Test context manager
+    async with provider as p:
+        logger.debug("Entering provider context...")
+        assert p == provider
+        assert p.is_initialized
     
     # Provider should be closed after context
     assert not provider.is_initialized
@@ -588,13 +557,12 @@ async def test_provider_initialization(mock_config):
     logger.info("test_provider_initialization completed successfully")
 
 
-@pytest.mark.asyncio
-async def test_provider_generate(mock_config):
+async def test_provider_generate(mock_config_dict):
     """Test text generation with the provider."""
     logger.info("Starting test_provider_generate")
     
-    provider = OllamaLLMProvider(config=mock_config.to_dict())
-    logger.debug(f"Created provider with config: {mock_config}")
+    provider = OllamaLLMProvider(config=mock_config_dict)
+    logger.debug("Created provider with config: %s", mock_config_dict)
     
     # Mock the adapter
     mock_adapter = AsyncMock()
@@ -620,7 +588,6 @@ async def test_provider_generate(mock_config):
     logger.info("test_provider_generate completed successfully")
 
 
-@pytest.mark.asyncio
 async def test_provider_health_check():
     """Test health check with the provider."""
     logger.info("Starting test_provider_health_check")
@@ -641,24 +608,13 @@ async def test_provider_health_check():
     logger.info("test_provider_health_check completed successfully")
 
 
-@pytest.mark.asyncio
 async def test_model_manager(mock_api_client):
     """Test the model manager functionality."""
     logger.info("Starting test_model_manager")
     
     try:
-        # Reset call counts
-        logger.debug("Resetting mock call counts...")
-        # Reset all mock call counts and side effects
-        for attr in dir(mock_api_client):
-            if attr.startswith('_') or attr in ['assert_any_call', 'assert_called', 'assert_called_once', 
-                                             'assert_called_once_with', 'assert_has_calls', 'assert_not_called',
-                                             'method_calls', 'mock_add_spec', 'mock_calls', 'reset_mock']:
-                continue
-            mock = getattr(mock_api_client, attr, None)
-            if hasattr(mock, 'reset_mock'):
-                logger.debug(f"Resetting mock: {attr}")
-                mock.reset_mock()
+        # The mock_api_client fixture already cleared the call records of
+        # every client method
         
         # Create a model manager with the mock client
         logger.debug("Creating ModelManager...")
@@ -667,26 +623,26 @@ async def test_model_manager(mock_api_client):
         # Test listing models
         logger.debug("Testing list_models...")
         models = await manager.list_models(refresh=True)
-        logger.debug(f"Got models: {models}")
+        logger.debug("Got models: %s", models)
         assert TEST_MODEL in models, f"Expected {TEST_MODEL} in {models}"
         mock_api_client.get_models.assert_awaited_once()
         
-        # Test model exists
-        logger.debug("Testing model_exists...")
-        exists = await manager.model_exists(TEST_MODEL)
-        logger.debug(f"Model {TEST_MODEL} exists: {exists}")
+        # Both reads only use the cache list_models filled, so run them together
+        logger.debug("Testing model_exists and get_model_info...")
+        exists, model_info = await asyncio.gather(
+            manager.model_exists(TEST_MODEL),
+            manager.get_model_info(TEST_MODEL),
+        )
+        logger.debug("Model %s exists: %s", TEST_MODEL, exists)
         assert exists is True
-        
-        # Test getting model info
-        logger.debug("Testing get_model_info...")
-        model_info = await manager.get_model_info(TEST_MODEL)
-        logger.debug(f"Got model info: {model_info}")
+        logger.debug("Got model info: %s", model_info)
         assert model_info["name"] == TEST_MODEL
         
-        # Test pulling a model
-        logger.debug(f"Testing pull_model for {TEST_MODEL}...")
+        # Pull and delete change the cache, so they run one after another
+        logger.debug("Testing pull_model for %s...", TEST_MODEL)
         await manager.pull_model(TEST_MODEL)
-        logger.debug("Pull model call completed")
+        logger.debug("Testing delete_model for %s...", TEST_MODEL)
+        await manager.delete_model(TEST_MODEL)
         
         # Verify request was called correctly
         logger.debug("Verifying API request was made...")
@@ -697,20 +653,18 @@ async def test_model_manager(mock_api_client):
             raise AssertionError("Expected API request to be made")
             
         # Check if any request was a pull request
-        pull_requests = [
-            (args, kwargs) 
-            for args, kwargs in mock_api_client.request.await_args_list
-            if args and len(args) >= 2 and args[0] == 'POST' and args[1] == '/api/pull'
-        ]
+        kwargs = next(
+            (kw for a, kw in mock_api_client.request.await_args_list
+             if len(a) >= 2 and a[0] == 'POST' and a[1] == '/api/pull'),
+            None,
+        )
         
-        if not pull_requests:
+        if kwargs is None:
             logger.error("No pull model request was made")
             logger.debug("All requests: %s", mock_api_client.request.await_args_list)
             raise AssertionError("Expected pull model request to be made")
-                
-        # Get the pull request details
-        args, kwargs = pull_requests[0]
-        logger.debug(f"Pull request - method: {args[0]}, path: {args[1]}, data: {kwargs.get('data')}")
+        
+        logger.debug("Pull request data: %s", kwargs.get('data'))
         
         # Check if the model name is in the request data
         request_data = kwargs.get('data', {})
@@ -726,29 +680,22 @@ async def test_model_manager(mock_api_client):
             
         logger.info("Pull model request was made with the correct model name")
         
-        # Test deleting a model
-        logger.debug(f"Testing delete_model for {TEST_MODEL}...")
-        await manager.delete_model(TEST_MODEL)
-        logger.debug("Delete model call completed")
-        
         # Verify delete request was made correctly
         logger.debug("Verifying delete request was made...")
         
         # Check if any request was a delete request
-        delete_requests = [
-            (args, kwargs) 
-            for args, kwargs in mock_api_client.request.await_args_list
-            if args and len(args) >= 2 and args[0] == 'DELETE' and args[1] == '/api/delete'
-        ]
+        kwargs = next(
+            (kw for a, kw in mock_api_client.request.await_args_list
+             if len(a) >= 2 and a[0] == 'DELETE' and a[1] == '/api/delete'),
+            None,
+        )
         
-        if not delete_requests:
+        if kwargs is None:
             logger.error("No delete model request was made")
             logger.debug("All requests: %s", mock_api_client.request.await_args_list)
             raise AssertionError("Expected delete model request to be made")
-            
-        # Get the delete request details
-        args, kwargs = delete_requests[0]
-        logger.debug(f"Delete request - method: {args[0]}, path: {args[1]}, data: {kwargs.get('data')}")
+        
+        logger.debug("Delete request data: %s", kwargs.get('data'))
         
         # Check if the model name is in the request data
         request_data = kwargs.get('data', {})
@@ -763,148 +710,77 @@ async def test_model_manager(mock_api_client):
             raise AssertionError(error_msg)
             
         logger.info("Delete model request was made with the correct model name")
+        assert TEST_MODEL not in await manager.list_models()
         
         logger.info("test_model_manager completed successfully")
         
     except Exception as e:
-        logger.error(f"Error in test_model_manager: {str(e)}", exc_info=True)
+        logger.error("Error in test_model_manager: %s", e, exc_info=True)
         raise
 
 
-@pytest.mark.asyncio
 async def test_config_validation():
     """Test configuration validation."""
-    log_test_start("test_config_validation")
-    logger.info("Starting test_config_validation")
-    
-    try:
-        # Test valid configuration
-        log_test_step("Testing valid configuration")
-        logger.debug("Creating valid config...")
-        valid_config = OllamaConfig(
-            base_url="http://test:11434",
-            model=TEST_MODEL,
-            timeout=30,
-            max_tokens=4000,
-            temperature=0.1,
-            top_p=0.9,
-            top_k=40,
-            repeat_penalty=1.1,
-            stop=[],
-        )
-        logger.debug(f"Created config: {valid_config}")
-        
-        # Verify config values
-        log_test_step("Verifying config values")
-        logger.debug("Verifying config values...")
-        assert valid_config.model == TEST_MODEL, f"Expected model {TEST_MODEL}, got {valid_config.model}"
-        assert valid_config.base_url == "http://test:11434", f"Expected base_url http://test:11434, got {valid_config.base_url}"
-        assert valid_config.timeout == 30, f"Expected timeout 30, got {valid_config.timeout}"
-        logger.debug("Config values verified successfully")
-        
-        # Test serialization/deserialization
-        log_test_step("Testing serialization/deserialization")
-        logger.debug("Testing serialization/deserialization...")
-        config_dict = valid_config.to_dict()
-        logger.debug(f"Serialized config to dict: {config_dict}")
-        
-        deserialized = OllamaConfig.from_dict(config_dict)
-        logger.debug(f"Deserialized config: {deserialized}")
-        
-        # Verify deserialized config
-        log_test_step("Verifying deserialized config")
-        assert deserialized.model == valid_config.model, f"Model mismatch: {deserialized.model} != {valid_config.model}"
-        assert deserialized.base_url == valid_config.base_url, f"Base URL mismatch: {deserialized.base_url} != {valid_config.base_url}"
-        assert deserialized.timeout == valid_config.timeout, f"Timeout mismatch: {deserialized.timeout} != {valid_config.timeout}"
-        logger.debug("Deserialized config verified successfully")
-        
-        # Test invalid configurations
-        log_test_step("Testing invalid configurations")
-        logger.debug("Testing invalid configurations...")
-        
-        # Test that empty model names are allowed (no validation in OllamaConfig)
-        log_test_step("Testing empty model name")
-        logger.debug("Testing that empty model names are allowed...")
-        
-        # Create config with empty model name
-        config = OllamaConfig(base_url="http://test:11434", model="")
-        assert config.model == "", "Empty model name should be allowed"
-        
-        # Create config with whitespace model name
-        config = OllamaConfig(base_url="http://test:11434", model=" ")
-        assert config.model == " ", "Whitespace model name should be allowed"
-        
-        # Test that missing fields use default values
-        log_test_step("Testing default values")
-        logger.debug("Testing that missing fields use default values...")
-        
-        # Test with minimal config
-        minimal_config = OllamaConfig(base_url="http://test:11434", model=TEST_MODEL)
-        assert minimal_config.timeout == 60, f"Expected default timeout 60, got {minimal_config.timeout}"
-        assert minimal_config.temperature == 0.1, f"Expected default temperature 0.1, got {minimal_config.temperature}"
-        assert minimal_config.max_tokens == 4000, f"Expected default max_tokens 4000, got {minimal_config.max_tokens}"
-        assert minimal_config.top_p == 0.9, f"Expected default top_p 0.9, got {minimal_config.top_p}"
-        assert minimal_config.top_k == 40, f"Expected default top_k 40, got {minimal_config.top_k}"
-        assert minimal_config.repeat_penalty == 1.1, f"Expected default repeat_penalty 1.1, got {minimal_config.repeat_penalty}"
-        assert minimal_config.stop == [], f"Expected default stop [], got {minimal_config.stop}"
-        
-        logger.debug("Default values test passed")
-        
-        logger.info("test_config_validation completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Error in test_config_validation: {str(e)}", exc_info=True)
-        raise
-    
-    # Test that OllamaConfig allows all fields to be optional with defaults
-    log_test_step("Testing optional fields with defaults")
-    logger.debug("Testing that all fields are optional with defaults...")
-    
-    # Test minimal config with only required fields
-    minimal_config = OllamaConfig(base_url="http://test:11434", model=TEST_MODEL)
-    assert minimal_config.base_url == "http://test:11434"
-    assert minimal_config.model == TEST_MODEL
-    assert minimal_config.timeout == 60  # Default value
-    assert minimal_config.temperature == 0.1  # Default value
-    
-    # Test that OllamaConfig doesn't validate values
-    log_test_step("Testing that OllamaConfig doesn't validate values")
-    
-    # Test with empty model name (should be allowed)
-    empty_model_config = OllamaConfig(base_url="http://test:11434", model="")
-    assert empty_model_config.model == ""
-    
-    # Test with whitespace model name (should be allowed)
-    whitespace_model_config = OllamaConfig(base_url="http://test:11434", model=" ")
-    assert whitespace_model_config.model == " "
-    
-    # Test with negative timeout (should be allowed)
-    negative_timeout_config = OllamaConfig(base_url="http://test:11434", model=TEST_MODEL, timeout=-1)
-    assert negative_timeout_config.timeout == -1
-    
-    # Test with invalid temperature (should be allowed)
-    invalid_temp_config = OllamaConfig(base_url="http://test:11434", model=TEST_MODEL, temperature=-0.1)
-    assert invalid_temp_config.temperature == -0.1
-    
-    logger.info("test_config_validation completed successfully")
+    # Test valid configuration
+    valid_config = OllamaConfig(
+        base_url="http://test:11434",
+        model=TEST_MODEL,
+        timeout=30,
+        max_tokens=4000,
+        temperature=0.1,
+        top_p=0.9,
+        top_k=40,
+        repeat_penalty=1.1,
+        stop=[],
+    )
+    assert valid_config.model == TEST_MODEL
+    assert valid_config.base_url == "http://test:11434"
+    assert valid_config.timeout == 30
+    
+    # Test serialization/deserialization
+    deserialized = OllamaConfig.from_dict(valid_config.to_dict())
+    assert deserialized.model == valid_config.model
+    assert deserialized.base_url == valid_config.base_url
+    assert deserialized.timeout == valid_config.timeout
+
+
+@pytest.mark.parametrize("kwargs,attr,value", [
+    # OllamaConfig doesn't validate values
+    ({"base_url": "http://test:11434", "model": ""}, "model", ""),
+    ({"base_url": "http://test:11434", "model": " "}, "model", " "),
+    ({**_MINIMAL_CONFIG, "timeout": -1}, "timeout", -1),
+    ({**_MINIMAL_CONFIG, "temperature": -0.1}, "temperature", -0.1),
+    # Missing fields use default values
+    (_MINIMAL_CONFIG, "base_url", "http://test:11434"),
+    (_MINIMAL_CONFIG, "model", TEST_MODEL),
+    (_MINIMAL_CONFIG, "timeout", 60),
+    (_MINIMAL_CONFIG, "temperature", 0.1),
+    (_MINIMAL_CONFIG, "max_tokens", 4000),
+    (_MINIMAL_CONFIG, "top_p", 0.9),
+    (_MINIMAL_CONFIG, "top_k", 40),
+    (_MINIMAL_CONFIG, "repeat_penalty", 1.1),
+    (_MINIMAL_CONFIG, "stop", []),
+])
+def test_config_field(kwargs, attr, value):
+    """Test individual OllamaConfig fields, including defaults."""
+    assert getattr(OllamaConfig(**kwargs), attr) == value
 
 
-@pytest.mark.asyncio
 async def test_error_handling(mock_adapter, mock_api_client):
     """Test error handling in the adapter."""
     # Test API error
-    mock_api_client.generate = AsyncMock(side_effect=ClientError("API error"))
+    mock_api_client.generate = _GEN_ERR_CLIENT
     
     with pytest.raises(ModelOperationError):
         await mock_adapter.generate(prompt=TEST_PROMPT)
     
     # Test model not found
-    mock_api_client.generate = AsyncMock(side_effect=ModelNotFoundError("Model not found"))
+    mock_api_client.generate = _GEN_ERR_NOT_FOUND
     
     with pytest.raises(ModelNotFoundError):
         await mock_adapter.generate(prompt=TEST_PROMPT, model="nonexistent-model")
     
     # Test generation error
-    mock_adapter.api_client.generate = AsyncMock(side_effect=Exception("Generation failed"))
+    mock_adapter.api_client.generate = _GEN_ERR
     with pytest.raises(ModelOperationError):
         await mock_adapter.generate(prompt=TEST_PROMPT)
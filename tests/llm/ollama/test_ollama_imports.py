@@ -1,69 +1,41 @@
 """Test file specifically for testing Ollama imports in isolation."""
+import importlib.util
 import sys
-import types
-import pytest
-from unittest.mock import MagicMock, patch
 
-# Mock the openai module
-sys.modules['openai'] = MagicMock()
 
-# Create mock modules for OpenAI provider
-mock_openai_provider = types.ModuleType('gollm.llm.providers.openai')
-mock_openai_provider.OpenAIClient = type('MockOpenAIClient', (), {})
-mock_openai_provider.OpenAILlmProvider = type('MockOpenAILlmProvider', (), {})
-sys.modules['gollm.llm.providers.openai'] = mock_openai_provider
-
-# Mock the Ollama HTTP client
-class MockOllamaHttpClient:
-    pass
-
-# Create mock modules for Ollama provider
-mock_ollama_provider = types.ModuleType('gollm.llm.providers.ollama')
-mock_ollama_provider.OllamaHttpClient = MockOllamaHttpClient
-mock_ollama_provider.OllamaLLMProvider = type('OllamaLLMProvider', (), {})
-mock_ollama_provider.OllamaConfig = type('OllamaConfig', (), {})
-mock_ollama_provider.OllamaAdapter = type('OllamaAdapter', (), {})
-mock_ollama_provider.OllamaError = type('OllamaError', (Exception,), {})
-sys.modules['gollm.llm.providers.ollama'] = mock_ollama_provider
-
-# Mock the HTTP adapter
-mock_http_adapter = types.ModuleType('gollm.llm.providers.ollama.http')
-mock_http_adapter.OllamaHttpClient = MockOllamaHttpClient
-mock_http_adapter.OllamaHttpAdapter = type('OllamaHttpAdapter', (), {})
-sys.modules['gollm.llm.providers.ollama.http'] = mock_http_adapter
-
-# Now import the modules we want to test
-with patch.dict('sys.modules', {
-    'gollm.llm.providers.openai': mock_openai_provider,
-    'gollm.llm.providers.ollama': mock_ollama_provider,
-    'gollm.llm.providers.ollama.http': mock_http_adapter,
-}):
-    from gollm.llm.providers.ollama import OllamaConfig, OllamaAdapter, OllamaLLMProvider, OllamaError
-    from gollm.llm.base import BaseLLMProvider, BaseLLMConfig, BaseLLMAdapter
-    from gollm.llm.exceptions import (
-    LLMError, ModelError, ModelNotFoundError, ModelOperationError,
-    ConfigurationError, ValidationError, APIError, AuthenticationError,
-    RateLimitError, TimeoutError, GenerationError, InvalidPromptError,
-    ContextLengthExceededError
-)
+def test_ollama_package_found(monkeypatch):
+    """Test that the real Ollama provider package can be found."""
+    # find_spec consults sys.modules first; drop the conftest stub
+    monkeypatch.delitem(sys.modules, "gollm.llm.providers.ollama", raising=False)
+    assert importlib.util.find_spec("gollm.llm.providers.ollama") is not None
 
 def test_ollama_imports():
     """Test that we can import the required Ollama modules."""
-    # These imports should work because we mocked the modules
+    # conftest.py provides stub modules if the real ones are not loaded
+    from gollm.llm.providers.ollama import OllamaConfig, OllamaAdapter, OllamaLLMProvider
+
     assert OllamaConfig is not None
     assert OllamaAdapter is not None
     assert OllamaLLMProvider is not None
-    assert OllamaError is not None
 
 def test_llm_base_imports():
     """Test that we can import the base LLM classes."""
     # These are the base classes that should always be available
+    from gollm.llm.base import BaseLLMProvider, BaseLLMConfig, BaseLLMAdapter
+
     assert BaseLLMProvider is not None
     assert BaseLLMConfig is not None
     assert BaseLLMAdapter is not None
 
 def test_exceptions_import():
     """Test that we can import the exceptions."""
+    from gollm.llm.exceptions import (
+        LLMError, ModelError, ModelNotFoundError, ModelOperationError,
+        ConfigurationError, ValidationError, APIError, AuthenticationError,
+        RateLimitError, TimeoutError, GenerationError, InvalidPromptError,
+        ContextLengthExceededError
+    )
+
     assert LLMError is not None
     assert ModelError is not None
     assert ModelNotFoundError is not None
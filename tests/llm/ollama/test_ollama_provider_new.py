@@ -1,30 +1,8 @@
 """Comprehensive tests for the Ollama LLM Provider."""
 import json
-import sys
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
-
-# Mock the openai module before any imports
-sys.modules['openai'] = MagicMock()
-
-# Mock the aiohttp module
-sys.modules['aiohttp'] = MagicMock()
-
-# Mock the OpenAIClient import
-class MockOpenAIClient:
-    pass
-
-# Mock the OpenAILlmProvider class
-class MockOpenAILlmProvider:
-    pass
-
-# Create a mock for the openai provider module
-mock_openai_provider = type('module', (), {
-    'OpenAIClient': MockOpenAIClient,
-    'OpenAILlmProvider': MockOpenAILlmProvider
-})
-sys.modules['gollm.llm.providers.openai'] = mock_openai_provider
+from unittest.mock import AsyncMock, patch
 
 # Test data
 TEST_MODEL = "llama2"
@@ -76,14 +54,14 @@ class MockOllamaAdapter:
             }
         }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_ollama_adapter():
     with patch('gollm.llm.ollama_adapter.OllamaAdapter') as mock:
         adapter = MockOllamaAdapter({})
         mock.return_value = adapter
         yield adapter
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def ollama_provider(mock_ollama_adapter):
     """Create an Ollama provider instance with mocked dependencies."""
     from gollm.llm.ollama_adapter import OllamaLLMProvider
@@ -110,7 +88,16 @@ async def ollama_provider(mock_ollama_adapter):
     
     return provider, mock_ollama_adapter
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def _reset_adapter(ollama_provider):
+    """Clear call records and side effects left by the previous test.
+
+    reset_mock() keeps the canned return values set up by ollama_provider.
+    """
+    _, mock_adapter = ollama_provider
+    mock_adapter.generate_code.reset_mock(side_effect=True)
+    mock_adapter.health_check.reset_mock(side_effect=True)
+
 async def test_generate_response(ollama_provider):
     """Test generating a response with the Ollama provider."""
     provider, mock_adapter = ollama_provider
@@ -125,7 +112,6 @@ async def test_generate_response(ollama_provider):
         context=None
     )
 
-@pytest.mark.asyncio
 async def test_health_check(ollama_provider):
     """Test the health check functionality."""
     provider, mock_adapter = ollama_provider
@@ -138,7 +124,6 @@ async def test_health_check(ollama_provider):
     assert health["model_available"] is True
     mock_adapter.health_check.assert_awaited_once()
 
-@pytest.mark.asyncio
 async def test_error_handling(ollama_provider):
     """Test error handling in the Ollama provider."""
     provider, mock_adapter = ollama_provider
@@ -152,7 +137,6 @@ async def test_error_handling(ollama_provider):
     
     assert "API Error" in str(exc_info.value)
 
-@pytest.mark.asyncio
 async def test_custom_parameters(ollama_provider):
     """Test passing custom parameters to the Ollama provider."""
     provider, mock_adapter = ollama_provider
@@ -10,6 +10,32 @@ from gollm.validation.validators.incomplete_function_detector import (
     extract_completed_functions
 )
 
+# Sample source with one stub function, and the same source after the
+# stub has been filled in
+INCOMPLETE_CODE = """
+def complete_function():
+    return True
+
+def incomplete_function():
+    pass
+"""
+
+COMPLETED_CODE = """
+def complete_function():
+    return True
+
+def incomplete_function():
+    # Implementation added
+    data = process_data()
+    return data * 2
+"""
+
+
+@pytest.fixture(scope="module")
+def original_detection():
+    """Incomplete-function detection result for INCOMPLETE_CODE."""
+    return contains_incomplete_functions(INCOMPLETE_CODE)
+
 
 @pytest.fixture
 def mock_config():
@@ -35,17 +61,8 @@ def mock_code_validator():
 
 def test_incomplete_function_detection():
     """Test that incomplete functions are properly detected."""
-    # Code with incomplete function
-    code = """
-def complete_function():
-    return True
-
-def incomplete_function():
-    pass
-"""
-    
     # Check if incomplete functions are detected
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
+    has_incomplete, incomplete_funcs = contains_incomplete_functions(INCOMPLETE_CODE)
     
     assert has_incomplete is True
     assert len(incomplete_funcs) == 1
@@ -54,20 +71,11 @@ def incomplete_function():
 
 def test_format_for_completion_output():
     """Test that the format_for_completion function produces correct output."""
-    # Code with incomplete function
-    code = """
-def complete_function():
-    return True
-
-def incomplete_function():
-    pass
-"""
-    
     # Get incomplete functions
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
+    has_incomplete, incomplete_funcs = contains_incomplete_functions(INCOMPLETE_CODE)
     
     # Format for completion
-    formatted = format_for_completion(incomplete_funcs, code)
+    formatted = format_for_completion(incomplete_funcs, INCOMPLETE_CODE)
     
     # Check that the formatted code contains the expected markers
     assert "TODO: Implement the incomplete_function function below" in formatted
@@ -75,30 +83,13 @@ def incomplete_function():
     assert "def incomplete_function():" in formatted
 
 
-def test_extract_completed_functions_output():
+def test_extract_completed_functions_output(original_detection):
     """Test that completed functions are correctly extracted and merged."""
-    # Original code with incomplete function
-    original_code = """
-def complete_function():
-    return True
-
-def incomplete_function():
-    pass
-"""
-    
-    # Completed code from LLM
-    completed_code = """
-def complete_function():
-    return True
-
-def incomplete_function():
-    # Implementation added
-    data = process_data()
-    return data * 2
-"""
-    
-    # Extract and merge completed functions
-    merged_code = extract_completed_functions(original_code, completed_code)
+    # Extract and merge the completed functions from the LLM's code
+    _, incomplete_funcs = original_detection
+    merged_code = extract_completed_functions(
+        INCOMPLETE_CODE, COMPLETED_CODE, incomplete_funcs
+    )
     
     # Check that the incomplete function was replaced with the completed version
     assert "pass" not in merged_code
@@ -113,24 +104,10 @@ async def test_orchestrator_iterative_completion(mock_llm_call, mock_config, moc
     orchestrator = LLMOrchestrator(mock_config, code_validator=mock_code_validator)
     
     # Mock first response with incomplete function
-    first_response = """
-def complete_function():
-    return True
-
-def incomplete_function():
-    pass
-"""
+    first_response = INCOMPLETE_CODE
     
     # Mock second response with completed function
-    second_response = """
-def complete_function():
-    return True
-
-def incomplete_function():
-    # Implementation added
-    data = process_data()
-    return data * 2
-"""
+    second_response = COMPLETED_CODE
     
     # Configure mock to return different responses for each call
     mock_llm_call.side_effect = [first_response, second_response]
@@ -8,13 +8,12 @@ using both HTTP and gRPC adapters, with timing information for comparison.
 
 import asyncio
 import logging
-# Add the src directory to the path so we can import gollm
-import sys
+import socket
 import time
-from pathlib import Path
+from contextlib import AsyncExitStack
+from urllib.parse import urlsplit
 
-src_dir = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_dir))
+import pytest
 
 from gollm.llm.direct_api import DirectLLMClient
 
@@ -23,93 +22,165 @@ logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+BASE_URL = "http://localhost:11434"
 
-async def test_generate(use_grpc=False):
-    """Test the generate method with HTTP or gRPC."""
-    adapter_type = "gRPC" if use_grpc else "HTTP"
-    print(f"\n=== Testing generate with {adapter_type} ===\n")
+
+def _probe(url, timeout=0.25):
+    """Return True if something accepts TCP connections at the URL's host:port."""
+    parts = urlsplit(url)
+    try:
+        with socket.create_connection((parts.hostname, parts.port or 80), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+# Under pytest these checks need a live Ollama server
+requires_server = pytest.mark.skipif(
+    not _probe(BASE_URL), reason=f"{BASE_URL} is unreachable"
+)
+
+
+@pytest.mark.integration
+@requires_server
+async def test_generate(client=None):
+    """Test the generate method with an open HTTP or gRPC client."""
+    if client is None:
+        async with DirectLLMClient(base_url=BASE_URL) as client:
+            return await test_generate(client)
+
+    adapter_type = "gRPC" if client.use_grpc else "HTTP"
+    # Buffer output so concurrent runs print their blocks whole
+    out = [f"\n=== Testing generate with {adapter_type} ===\n"]
 
     start_time = time.time()
-    async with DirectLLMClient(
-        base_url="http://localhost:11434", use_grpc=use_grpc
-    ) as client:
-        result = await client.generate(
-            model="deepseek-coder:1.3b",
-            prompt="Write a simple Python function to calculate the factorial of a number.",
-            temperature=0.1,
-            max_tokens=500,
-        )
+    result = await client.generate(
+        model="deepseek-coder:1.3b",
+        prompt="Write a simple Python function to calculate the factorial of a number.",
+        temperature=0.1,
+        max_tokens=500,
+    )
     end_time = time.time()
+    assert "error" not in result, result["error"]
 
     # Print result and timing
-    print(f"\nGenerated response ({adapter_type}):")
+    out.append(f"\nGenerated response ({adapter_type}):")
     if "response" in result:
-        print(
-            result["response"][:500] + "..."
-            if len(result["response"]) > 500
-            else result["response"]
-        )
-    elif "message" in result and isinstance(result["message"], dict):
-        content = result["message"].get("content", "")
-        print(content[:500] + "..." if len(content) > 500 else content)
+        content = result["response"]
+    else:
+        content = (result.get("message") or {}).get("content", "")
+    assert content.strip(), f"Empty generate response: {result}"
+    out.append(content[:500] + "..." if len(content) > 500 else content)
 
-    print(f"\nTime taken: {end_time - start_time:.2f} seconds")
+    out.append(f"\nTime taken: {end_time - start_time:.2f} seconds")
 
     # Print API-reported timing if available
     if "total_duration" in result:
         duration_ms = (
             result["total_duration"] / 1_000_000
         )  # Convert nanoseconds to milliseconds
-        print(f"API-reported duration: {duration_ms:.2f}ms")
+        out.append(f"API-reported duration: {duration_ms:.2f}ms")
 
+    print("\n".join(out))
 
-async def test_chat(use_grpc=False):
-    """Test the chat_completion method with HTTP or gRPC."""
-    adapter_type = "gRPC" if use_grpc else "HTTP"
-    print(f"\n=== Testing chat with {adapter_type} ===\n")
+
+@pytest.mark.integration
+@requires_server
+async def test_chat(client=None):
+    """Test the chat_completion method with an open HTTP or gRPC client."""
+    if client is None:
+        async with DirectLLMClient(base_url=BASE_URL) as client:
+            return await test_chat(client)
+
+    adapter_type = "gRPC" if client.use_grpc else "HTTP"
+    out = [f"\n=== Testing chat with {adapter_type} ===\n"]
 
     start_time = time.time()
-    async with DirectLLMClient(
-        base_url="http://localhost:11434", use_grpc=use_grpc
-    ) as client:
-        result = await client.chat_completion(
-            model="deepseek-coder:1.3b",
-            messages=[
-                {
-                    "role": "user",
-                    "content": "Explain the difference between HTTP and gRPC in 3 sentences.",
-                }
-            ],
-            temperature=0.1,
-            max_tokens=500,
-        )
+    result = await client.chat_completion(
+        model="deepseek-coder:1.3b",
+        messages=[
+            {
+                "role": "user",
+                "content": "Explain the difference between HTTP and gRPC in 3 sentences.",
+            }
+        ],
+        temperature=0.1,
+        max_tokens=500,
+    )
     end_time = time.time()
+    assert "error" not in result, result["error"]
 
     # Print result and timing
-    print(f"\nChat response ({adapter_type}):")
-    if "message" in result and isinstance(result["message"], dict):
-        content = result["message"].get("content", "")
-        print(content[:500] + "..." if len(content) > 500 else content)
+    out.append(f"\nChat response ({adapter_type}):")
+    content = (result.get("message") or {}).get("content", "")
+    assert content.strip(), f"Empty chat response: {result}"
+    out.append(content[:500] + "..." if len(content) > 500 else content)
 
-    print(f"\nTime taken: {end_time - start_time:.2f} seconds")
+    out.append(f"\nTime taken: {end_time - start_time:.2f} seconds")
 
     # Print API-reported timing if available
     if "total_duration" in result:
         duration_ms = (
             result["total_duration"] / 1_000_000
         )  # Convert nanoseconds to milliseconds
-        print(f"API-reported duration: {duration_ms:.2f}ms")
+        out.append(f"API-reported duration: {duration_ms:.2f}ms")
+
+    print("\n".join(out))
+
+
+async def run_concurrent_generate(client, requests=8):
+    """Send many generate calls at once through an open client.
+
+    With a gRPC client the calls spread over its channel pool; with an
+    HTTP client they share its connection pool.
+    """
+    adapter_type = "gRPC" if client.use_grpc else "HTTP"
+    out = [f"\n=== Testing {requests} concurrent generates with {adapter_type} ===\n"]
+
+    start_time = time.time()
+    results = await asyncio.gather(
+        *(
+            client.generate(
+                model="deepseek-coder:1.3b",
+                prompt=f"Write a Python one-liner that returns {i} squared.",
+                temperature=0.1,
+                max_tokens=50,
+            )
+            for i in range(requests)
+        )
+    )
+    end_time = time.time()
+
+    completed = sum(1 for result in results if "response" in result)
+    out.append(f"Completed responses: {completed}/{requests}")
+    out.append(f"\nTime taken: {end_time - start_time:.2f} seconds")
+
+    print("\n".join(out))
 
 
 async def run_tests():
-    """Run all tests."""
-    # Test with HTTP
-    await test_generate(use_grpc=False)
-    await test_chat(use_grpc=False)
-
-    # Test with gRPC
-    await test_generate(use_grpc=True)
-    await test_chat(use_grpc=True)
+    """Run all tests concurrently over HTTP and gRPC."""
+    # One client per transport, shared by its calls so connections are reused
+    async with AsyncExitStack() as stack:
+        http_client = await stack.enter_async_context(
+            DirectLLMClient(base_url=BASE_URL, use_grpc=False)
+        )
+        checks = [test_generate(http_client), test_chat(http_client)]
+
+        # Probe once instead of waiting out a connect timeout per gRPC call
+        grpc_client = None
+        if _probe(BASE_URL):
+            grpc_client = await stack.enter_async_context(
+                DirectLLMClient(base_url=BASE_URL, use_grpc=True, grpc_pool_size=4)
+            )
+            checks += [test_generate(grpc_client), test_chat(grpc_client)]
+        else:
+            print(f"\n{BASE_URL} is unreachable, skipping the gRPC checks")
+
+        await asyncio.gather(*checks)
+        if grpc_client:
+            # More requests than channels, so the pool is actually exercised
+            await run_concurrent_generate(grpc_client, requests=8)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,21 @@
+import copy
 import os
-import tempfile
 from datetime import datetime
 
 import pytest
 
-from gollm.config.config import GollmConfig
 from gollm.project_management.changelog_manager import ChangelogManager
 
 
 class TestChangelogManager:
 
     @pytest.fixture
-    def config(self):
+    def config(self, gollm_config, tmp_path):
         """Test configuration with temporary CHANGELOG file"""
-        config = GollmConfig.default()
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            config.project_management.changelog_file = f.name
+        config = copy.deepcopy(gollm_config)
+        changelog_file = tmp_path / "CHANGELOG.md"
+        changelog_file.touch()
+        config.project_management.changelog_file = str(changelog_file)
         return config
 
     @pytest.fixture
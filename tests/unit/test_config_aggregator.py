@@ -1,66 +1,61 @@
 import json
 import os
-import tempfile
-from pathlib import Path
 
 import pytest
 
 from gollm.config.aggregator import ProjectConfigAggregator
 
 
-class TestProjectConfigAggregator:
+@pytest.fixture(scope="module")
+def temp_project_dir(tmp_path_factory):
+    """Create temporary project directory with config files"""
+    project_dir = tmp_path_factory.mktemp("project")
 
-    @pytest.fixture
-    def temp_project_dir(self):
-        """Create temporary project directory with config files"""
-        temp_dir = tempfile.mkdtemp()
-
-        # Create sample gollm.json
-        gollm_config = {
-            "validation_rules": {
-                "max_function_lines": 50,
-                "forbid_print_statements": True,
-            }
+    # Create sample gollm.json
+    gollm_config = {
+        "validation_rules": {
+            "max_function_lines": 50,
+            "forbid_print_statements": True,
         }
+    }
+    (project_dir / "gollm.json").write_text(
+        json.dumps(gollm_config, separators=(",", ":"))
+    )
 
-        with open(Path(temp_dir) / "gollm.json", "w") as f:
-            json.dump(gollm_config, f)
-
-        # Create sample .flake8
-        flake8_config = """[flake8]
+    # Create sample .flake8
+    flake8_config = """[flake8]
 max-line-length = 88
 ignore = E203,W503
 max-complexity = 10
 """
-        with open(Path(temp_dir) / ".flake8", "w") as f:
-            f.write(flake8_config)
+    (project_dir / ".flake8").write_text(flake8_config)
 
-        yield temp_dir
+    return str(project_dir)
 
-        # Cleanup
-        import shutil
 
-        shutil.rmtree(temp_dir)
+@pytest.fixture(scope="module")
+def aggregator(temp_project_dir):
+    """Aggregator built once; discovery and parsing are shared by the tests"""
+    return ProjectConfigAggregator(temp_project_dir)
 
-    def test_config_discovery(self, temp_project_dir):
-        """Test configuration file discovery"""
-        aggregator = ProjectConfigAggregator(temp_project_dir)
 
+class TestProjectConfigAggregator:
+
+    def test_config_discovery(self, aggregator):
+        """Test configuration file discovery"""
         assert "gollm.json" in aggregator.config_files
         assert ".flake8" in aggregator.config_files
 
-    def test_config_aggregation(self, temp_project_dir):
+    def test_config_aggregation(self, aggregator):
         """Test configuration aggregation"""
-        aggregator = ProjectConfigAggregator(temp_project_dir)
         config = aggregator.get_aggregated_config()
 
         assert "gollm_rules" in config
         assert "linting_rules" in config
         assert config["gollm_rules"]["validation_rules"]["max_function_lines"] == 50
 
-    def test_llm_config_summary(self, temp_project_dir):
+    def test_llm_config_summary(self, aggregator):
         """Test LLM configuration summary generation"""
-        aggregator = ProjectConfigAggregator(temp_project_dir)
         summary = aggregator.get_llm_config_summary()
 
         assert isinstance(summary, str)
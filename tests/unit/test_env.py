@@ -2,8 +2,7 @@
 
 import os
 import sys
-
-import pkg_resources
+from importlib.metadata import distributions
 
 
 def main():
@@ -16,7 +15,8 @@ def main():
         print(f"  - {p}")
 
     print("\nInstalled Packages:")
-    for pkg in sorted([p.key for p in pkg_resources.working_set]):
+    names = {d.metadata["Name"].lower() for d in distributions() if d.metadata["Name"]}
+    for pkg in sorted(names):
         print(f"  - {pkg}")
 
     print("\nTrying to import gollm...")
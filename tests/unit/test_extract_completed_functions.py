@@ -0,0 +1,126 @@
+"""Tests for merging completed functions back into the original code."""
+
+import ast
+
+from gollm.validation.validators.incomplete_function_detector import (
+    extract_completed_functions,
+)
+
+
+def test_splices_several_functions_bottom_up():
+    """Replacements of different lengths must not shift later splices."""
+    original = '''def first():
+    pass
+
+def middle():
+    return 1
+
+def last():
+    ...
+'''
+    completed = '''def first():
+    a = 1
+    b = 2
+    c = 3
+    return a + b + c
+
+def last():
+    return "done"
+'''
+    merged = extract_completed_functions(original, completed)
+
+    assert merged == '''def first():
+    a = 1
+    b = 2
+    c = 3
+    return a + b + c
+
+def middle():
+    return 1
+
+def last():
+    return "done"
+'''
+
+
+def test_reindents_method_completed_at_top_level():
+    """A method keeps its class indentation (non-zero col_offset)."""
+    original = '''class Greeter:
+    def greet(self, name):
+        pass
+
+    def wave(self):
+        return "wave"
+'''
+    completed = '''def greet(self, name):
+    # Build the greeting
+    return f"Hello, {name}"
+'''
+    merged = extract_completed_functions(original, completed)
+
+    assert merged == '''class Greeter:
+    def greet(self, name):
+        # Build the greeting
+        return f"Hello, {name}"
+
+    def wave(self):
+        return "wave"
+'''
+
+
+def test_dedents_nested_completion_into_top_level_function():
+    """A completion written as a method is moved to column 0."""
+    original = '''def helper():
+    pass
+'''
+    completed = '''class Wrapper:
+    def helper():
+        return 42
+'''
+    merged = extract_completed_functions(original, completed)
+
+    assert merged == '''def helper():
+    return 42
+'''
+
+
+def test_accepts_async_completion():
+    """An async def in the completion replaces the incomplete function."""
+    original = '''def fetch(url):
+    pass
+'''
+    completed = '''async def fetch(url):
+    return await get(url)
+'''
+    merged = extract_completed_functions(original, completed)
+
+    assert merged == completed
+
+
+def test_keeps_multiline_string_contents():
+    """Lines inside a multi-line string are not re-indented."""
+    original = '''class Report:
+    def render(self):
+        pass
+'''
+    completed = '''def render(self):
+    text = """
+header
+  body
+"""
+    return text
+'''
+    merged = extract_completed_functions(original, completed)
+
+    namespace = {}
+    exec(compile(merged, "<merged>", "exec"), namespace)
+    assert namespace["Report"]().render() == "\nheader\n  body\n"
+    ast.parse(merged)
+
+
+def test_trailing_newline_follows_original():
+    """The merged code ends with a newline exactly when the original does."""
+    completed = "def run():\n    return 1\n"
+
+    assert extract_completed_functions("def run():\n    pass\n", completed).endswith("\n")
+    assert not extract_completed_functions("def run():\n    pass", completed).endswith("\n")
@@ -74,7 +74,7 @@ def main():
     
     # Test extracting completed functions
     print("\nExtracting and merging completed functions:")
-    merged_code = extract_completed_functions(test_code, completed_code)
+    merged_code = extract_completed_functions(test_code, completed_code, incomplete_funcs)
     print("\nMerged code snippet:")
     print(merged_code[:200] + "...")
     
@@ -2,16 +2,117 @@ import aiohttp
 import asyncio
 import json
 import os
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
 
+import pytest
+
+# Writes hello_world.py to the working directory, so keep it off xdist workers
+pytestmark = pytest.mark.serial
+
+# Body of the first ```python block, and the first line starting with print
+_CODE_RE = re.compile(r"```python\s*(.*?)```", re.DOTALL)
+_PRINT_RE = re.compile(r"^[ \t]*(print.*)$", re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str, mtime):
+    """Parse a config file; mtime is part of the key so edits are picked up"""
+    with open(path_str, 'rb') as f:
+        return json.loads(f.read())
+
+
 def load_config():
-    """Load configuration from gollm.json"""
-    config_path = Path('gollm.json')
+    """Load configuration from gollm.json
+
+    The parsed dict is cached and shared between calls, so treat it as read-only.
+    """
+    config_path = Path('gollm.json').resolve()
     if not config_path.exists():
         raise FileNotFoundError("gollm.json not found in the current directory")
     
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    return _load_config_cached(str(config_path), config_path.stat().st_mtime)
+
+
+_session = None
+
+
+def get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=60
+            )
+        )
+    return _session
+
+
+async def close_session():
+    """Close the shared HTTP session if one was opened"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def _close_shared_session():
+    """Close the shared session once the module's tests are done"""
+    yield
+    await close_session()
+
+
+async def _read_stream_text(response, api_type):
+    """Join the text of an NDJSON response, stopping at the record with done=True"""
+    parts = []
+    async for line in response.content:
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        if api_type == 'chat':
+            parts.append(data.get('message', {}).get('content', ''))
+        else:
+            parts.append(data.get('response', ''))
+        if data.get('done'):
+            break
+    return "".join(parts)
+
+
+def _payload_for(payload_base, api_type, prompt):
+    """Copy a request payload with its user prompt replaced, as a single JSON reply"""
+    if api_type == 'chat':
+        messages = payload_base["messages"][:-1] + [{"role": "user", "content": prompt}]
+        return {**payload_base, "messages": messages, "stream": False}
+    return {**payload_base, "prompt": prompt, "stream": False}
+
+
+async def _one(session, endpoint, payload, sem):
+    async with sem:
+        async with session.post(
+            endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=120)
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def run_prompts(session, endpoint, payload_base, api_type, prompts, concurrency=8):
+    """Send prompts concurrently, at most `concurrency` in flight at once"""
+    sem = asyncio.Semaphore(concurrency)
+    start_time = time.perf_counter()
+    results = await asyncio.gather(
+        *[_one(session, endpoint, _payload_for(payload_base, api_type, p), sem) for p in prompts],
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start_time
+    succeeded = sum(1 for r in results if not isinstance(r, BaseException))
+    print(f"\n{succeeded}/{len(prompts)} prompts succeeded in {elapsed:.2f}s "
+          f"(concurrency {concurrency})")
+    return results
+
 
 async def test_ollama():
     try:
@@ -37,68 +138,77 @@ async def test_ollama():
                     {"role": "system", "content": "You are a helpful coding assistant that generates clean, simple Python code."},
                     {"role": "user", "content": "Write a Python program that prints 'Hello, World!'. Only include the code, no explanations."}
                 ],
-                "stream": False
+                "stream": True
             }
         else:  # Default to generate API
             endpoint = f"{base_url}/api/generate"
             payload = {
                 "model": model,
                 "prompt": "Write a Python program that prints 'Hello, World!'. Only include the code, no explanations.",
-                "stream": False
+                "stream": True
             }
         
         # Make the API request
-        async with aiohttp.ClientSession() as session:
-            print(f"\nSending request to: {endpoint}")
-            async with session.post(endpoint, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    
-                    # Extract the generated code based on API type
-                    if api_type == 'chat':
-                        generated_text = result.get('message', {}).get('content', '')
-                    else:
-                        generated_text = result.get('response', '')
-                    
-                    # Clean up the response
-                    if '```python' in generated_text:
-                        # Extract code from markdown code block
-                        code_start = generated_text.find('```python') + 9
-                        code_end = generated_text.find('```', code_start)
-                        if code_end > 0:
-                            generated_text = generated_text[code_start:code_end].strip()
-                    
-                    # If no code block, take the first line that starts with 'print'
-                    if not generated_text.strip().startswith('print'):
-                        for line in generated_text.split('\n'):
-                            if line.strip().startswith('print'):
-                                generated_text = line.strip()
-                                break
-                    
-                    # Ensure we have a valid print statement
-                    if not generated_text.strip().startswith('print'):
-                        generated_text = 'print("Hello, World!")'
-                    
-                    # Ensure it ends with a newline
-                    if not generated_text.endswith('\n'):
-                        generated_text += '\n'
-                    
-                    # Write to file
-                    with open('hello_world.py', 'w') as f:
-                        f.write(generated_text)
-                    
-                    print("\nGenerated hello_world.py with the following content:")
-                    print("-" * 40)
-                    print(generated_text, end='')
-                    print("-" * 40)
-                    print("\nYou can run it with: python3 hello_world.py")
-                else:
-                    error_text = await response.text()
-                    print(f"Error from Ollama API (HTTP {response.status}): {error_text}")
+        session = get_session()
+        print(f"\nSending request to: {endpoint}")
+        async with session.post(
+            endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=120)
+        ) as response:
+            if response.status == 200:
+                # Extract the generated code based on API type
+                generated_text = await _read_stream_text(response, api_type)
+                
+                # Clean up the response
+                match = _CODE_RE.search(generated_text)
+                if match:
+                    # Extract code from markdown code block
+                    generated_text = match.group(1).strip()
+                
+                # If no code block, take the first line that starts with 'print',
+                # falling back to a valid print statement
+                if not generated_text.lstrip().startswith('print'):
+                    match = _PRINT_RE.search(generated_text)
+                    generated_text = match.group(1).rstrip() if match else 'print("Hello, World!")'
+                
+                # Ensure it ends with a newline
+                if not generated_text.endswith('\n'):
+                    generated_text += '\n'
+                
+                # Write to file
+                with open('hello_world.py', 'w') as f:
+                    f.write(generated_text)
+                
+                print("\nGenerated hello_world.py with the following content:")
+                print("-" * 40)
+                print(generated_text, end='')
+                print("-" * 40)
+                print("\nYou can run it with: python3 hello_world.py")
+            else:
+                error_text = await response.text()
+                print(f"Error from Ollama API (HTTP {response.status}): {error_text}")
+        
+        # Optional throughput run on top of the single-prompt smoke test,
+        # e.g. OLLAMA_BENCH_PROMPTS=32 OLLAMA_CONCURRENCY=8
+        prompt_count = int(os.environ.get('OLLAMA_BENCH_PROMPTS', '0'))
+        if prompt_count > 0:
+            concurrency = int(os.environ.get('OLLAMA_CONCURRENCY', '8'))
+            prompts = [
+                f"Write a Python one-liner that prints {i} squared. Only include the code."
+                for i in range(prompt_count)
+            ]
+            await run_prompts(session, endpoint, payload, api_type, prompts, concurrency)
     except Exception as e:
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
 
+
+async def main():
+    try:
+        await test_ollama()
+    finally:
+        await close_session()
+
+
 if __name__ == "__main__":
-    asyncio.run(test_ollama())
+    asyncio.run(main())
@@ -1,17 +1,9 @@
 import asyncio
 from gollm.llm.providers.ollama.provider import OllamaLLMProvider
+from tests.conftest import cached_llm_call
 
-async def test_generate():
-    config = {
-        'base_url': 'http://rock:8081',
-        'model': 'deepseek-coder:latest', 
-        'api_type': 'chat',
-        'timeout': 60
-    }
-    
-    async with OllamaLLMProvider(config) as provider:
-        # Test with a very explicit prompt
-        prompt = """
+# Test with a very explicit prompt
+HELLO_WORLD_PROMPT = """
         I need a Python program that prints "Hello, World!" to the console.
         
         RULES:
@@ -25,9 +17,26 @@ async def test_generate():
         Your response should be exactly this single line:
         print("Hello, World!")
         """
-        
-        response = await provider.generate_response(prompt)
-        
+
+async def test_generate(prompts=None):
+    config = {
+        'base_url': 'http://rock:8081',
+        'model': 'deepseek-coder:latest', 
+        'api_type': 'chat',
+        'timeout': 60
+    }
+    prompts = prompts or [HELLO_WORLD_PROMPT]
+    
+    # One provider (and one HTTP session) shared by all prompts
+    async with OllamaLLMProvider(config) as provider:
+        responses = await asyncio.gather(*(
+            cached_llm_call(
+                config['model'], prompt, lambda p=prompt: provider.generate_response(p)
+            )
+            for prompt in prompts
+        ))
+    
+    for response in responses:
         print("\n=== Response ===")
         print(f"Success: {response['success']}")
         if response['success']:
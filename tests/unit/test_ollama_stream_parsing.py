@@ -0,0 +1,59 @@
+"""Tests for NDJSON stream coalescing in OllamaGenerator."""
+
+import json
+
+from gollm.llm.providers.ollama.modules.generation.generator import \
+    OllamaGenerator
+
+
+class FakeContent:
+    """Stands in for aiohttp's StreamReader, replaying fixed byte chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.content = FakeContent(chunks)
+
+
+def _records(*tokens):
+    return b"".join(
+        json.dumps({"response": token}).encode() + b"\n" for token in tokens
+    )
+
+
+async def test_records_are_coalesced_per_read():
+    """All complete records in one read come back as a single chunk."""
+    payload = _records("def ", "f", "():") + b'{"response": " pass"}'
+    split = len(_records("def ", "f")) + 5  # cut mid-record
+    response = FakeResponse([payload[:split], payload[split:]])
+    generator = OllamaGenerator(session=None, config={})
+
+    chunks = [
+        chunk
+        async for chunk in generator._iter_ndjson_text(
+            response, lambda data: data.get("response")
+        )
+    ]
+
+    assert chunks == ["def f", "():", " pass"]
+
+
+async def test_invalid_records_are_skipped():
+    response = FakeResponse([b"not json\n" + _records("ok")])
+    generator = OllamaGenerator(session=None, config={})
+
+    chunks = [
+        chunk
+        async for chunk in generator._iter_ndjson_text(
+            response, lambda data: data.get("response")
+        )
+    ]
+
+    assert chunks == ["ok"]
@@ -3,8 +3,10 @@
 import asyncio
 import logging
 import os
+import pytest
 from dotenv import load_dotenv
 from gollm.llm.provider_manager import LLMProviderManager
+from tests.conftest import cached_llm_call
 
 # Configure logging
 logging.basicConfig(
@@ -13,62 +15,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def test_provider_manager():
-    """Test the provider manager with different configurations."""
-    # Create a test configuration
-    config = {
-        "llm_integration": {
-            "enabled": True,
-            "default_provider": "ollama",
-            "fallback_order": ["ollama"],
-            "timeout": 30,
-            "max_retries": 2,
-            "providers": {
-                "ollama": {
-                    "enabled": True,
-                    "priority": 1,
-                    "base_url": "http://localhost:11434",
-                    "model": "llama2",
-                    "temperature": 0.7,
-                    "max_tokens": 1000,
-                    "timeout": 60
-                }
+# Test configuration
+CONFIG = {
+    "llm_integration": {
+        "enabled": True,
+        "default_provider": "ollama",
+        "fallback_order": ["ollama"],
+        "timeout": 30,
+        "max_retries": 2,
+        "providers": {
+            "ollama": {
+                "enabled": True,
+                "priority": 1,
+                "base_url": "http://localhost:11434",
+                "model": "llama2",
+                "temperature": 0.7,
+                "max_tokens": 1000,
+                "timeout": 60
             }
         }
     }
-    
-    # Initialize provider manager
-    manager = LLMProviderManager(config['llm_integration'])
-    
-    # Test prompt
-    prompt = "Write a Python function to calculate factorial"
+}
+
+
+def make_manager():
+    """Build a provider manager from the test configuration."""
+    return LLMProviderManager(CONFIG['llm_integration'])
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Provider manager shared by every test in this module."""
+    return make_manager()
+
+
+async def test_provider_manager(manager, prompts=None):
+    """Test the provider manager with different configurations."""
+    model = CONFIG['llm_integration']['providers']['ollama']['model']
+    prompts = prompts or ["Write a Python function to calculate factorial"]
     
     try:
-        # Get response from first available provider
-        response = await manager.get_response(prompt)
-        
-        # Print results
+        # Get responses from first available provider, all prompts at once
+        responses = await asyncio.gather(*(
+            cached_llm_call(model, prompt, lambda p=prompt: manager.get_response(p))
+            for prompt in prompts
+        ))
+    except Exception as e:
+        print(f"\n❌ Exception occurred: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    # Print results
+    all_ok = True
+    for response in responses:
         if response.get('success', False):
             print("\n✅ Success!")
             print(f"Model: {response.get('model_info', {}).get('model', 'unknown')}")
             print("\nGenerated code:")
             print(response.get('generated_code', 'No code generated'))
-            return True
         else:
             print("\n❌ Failed!")
             print(f"Error: {response.get('error', 'Unknown error')}")
             print(f"Tried providers: {response.get('provider_info', {}).get('tried_providers', [])}")
-            return False
-            
-    except Exception as e:
-        print(f"\n❌ Exception occurred: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+            all_ok = False
+    return all_ok
+
 
 if __name__ == "__main__":
     # Load environment variables
     load_dotenv()
     
     # Run the test
-    asyncio.run(test_provider_manager())
+    asyncio.run(test_provider_manager(make_manager()))
@@ -5,21 +5,9 @@ Test script for validating the output validator functionality.
 
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('validation_test.log')
-    ]
-)
-
-# Add the src directory to the path so we can import gollm modules
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
-
 from gollm.validation.output_validator import validate_saved_code
 
 # Test cases with escape sequences
@@ -41,60 +29,84 @@ test_cases = [
     }
 ]
 
-# Run the tests
-for test in test_cases:
-    print(f"\n=== Testing: {test['name']} ===")
-    
-    # First save the content to a file
-    filename = test["filename"]
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(test["content"])
-    print(f"Saved original content to {filename}")
-    
-    # Now validate the saved file
-    is_valid, issues, details = validate_saved_code(test["content"], filename)
-    
-    print(f"Validation result: {'PASSED' if is_valid else 'FAILED'}")
-    if issues:
-        print(f"Issues: {', '.join(issues)}")
-    
-    print("Details:")
-    for key, value in details.items():
-        if key != "diff_summary":  # Skip diff summary for brevity
-            print(f"  {key}: {value}")
-    
-    # Now use the file handling module to save the content properly
-    print("\nNow testing with gollm's file handling:")
-    from gollm.cli.utils.file_handling import save_generated_files
-    from gollm.validation.code_validator import validate_and_extract_code
-    
-    # First validate and extract code
-    is_valid, validated_content, validation_issues = validate_and_extract_code(
-        test["content"], 
-        filename.split(".")[-1],
-        {"strict_validation": False}
+
+def write_content(filename, content):
+    """Write content as UTF-8 bytes, with no newline translation."""
+    Path(filename).write_bytes(content.encode("utf-8"))
+
+
+def main():
+    """Write the samples to the current directory and validate them."""
+    # Configure logging
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('validation_test.log')
+        ]
     )
-    
-    print(f"Code validation: {'PASSED' if is_valid else 'FAILED'}")
-    if validation_issues:
-        print(f"Validation issues: {', '.join(validation_issues)}")
-    
-    # Save the validated content to a new file
-    fixed_filename = f"fixed_{filename}"
-    with open(fixed_filename, "w", encoding="utf-8") as f:
-        f.write(validated_content)
-    print(f"Saved validated content to {fixed_filename}")
-    
-    # Now validate the fixed file
-    is_valid, issues, details = validate_saved_code(test["content"], fixed_filename)
-    
-    print(f"Validation of fixed file: {'PASSED' if is_valid else 'FAILED'}")
-    if issues:
-        print(f"Issues: {', '.join(issues)}")
-    
-    print("Details:")
-    for key, value in details.items():
-        if key != "diff_summary":  # Skip diff summary for brevity
-            print(f"  {key}: {value}")
-
-print("\nTest completed. Check validation_test.log for detailed logs.")
+
+    # First save every test's content to its file; the writes overlap in threads
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as pool:
+        list(pool.map(write_content,
+                      [test["filename"] for test in test_cases],
+                      [test["content"] for test in test_cases]))
+
+    # Run the tests
+    for test in test_cases:
+        print(f"\n=== Testing: {test['name']} ===")
+
+        filename = test["filename"]
+        print(f"Saved original content to {filename}")
+
+        # Now validate the saved file
+        is_valid, issues, details = validate_saved_code(test["content"], filename)
+
+        print(f"Validation result: {'PASSED' if is_valid else 'FAILED'}")
+        if issues:
+            print(f"Issues: {', '.join(issues)}")
+
+        print("Details:")
+        for key, value in details.items():
+            if key != "diff_summary":  # Skip diff summary for brevity
+                print(f"  {key}: {value}")
+
+        # Now use the file handling module to save the content properly
+        print("\nNow testing with gollm's file handling:")
+        from gollm.cli.utils.file_handling import save_generated_files
+        from gollm.validation.code_validator import validate_and_extract_code
+
+        # First validate and extract code
+        is_valid, validated_content, validation_issues = validate_and_extract_code(
+            test["content"], 
+            filename.split(".")[-1],
+            {"strict_validation": False}
+        )
+
+        print(f"Code validation: {'PASSED' if is_valid else 'FAILED'}")
+        if validation_issues:
+            print(f"Validation issues: {', '.join(validation_issues)}")
+
+        # Save the validated content to a new file
+        fixed_filename = f"fixed_{filename}"
+        write_content(fixed_filename, validated_content)
+        print(f"Saved validated content to {fixed_filename}")
+
+        # Now validate the fixed file
+        is_valid, issues, details = validate_saved_code(test["content"], fixed_filename)
+
+        print(f"Validation of fixed file: {'PASSED' if is_valid else 'FAILED'}")
+        if issues:
+            print(f"Issues: {', '.join(issues)}")
+
+        print("Details:")
+        for key, value in details.items():
+            if key != "diff_summary":  # Skip diff summary for brevity
+                print(f"  {key}: {value}")
+
+    print("\nTest completed. Check validation_test.log for detailed logs.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Tests for the memoized validate_and_extract_code."""
+
+from unittest.mock import patch
+
+import pytest
+
+from gollm.validation.validators import validation_coordinator
+from gollm.validation.validators.validation_coordinator import (
+    _validate_and_extract_cached,
+    validate_and_extract_code,
+)
+
+CODE = "def add(a, b):\n    return a + b\n"
+
+
+@pytest.fixture(autouse=True)
+def spy():
+    """Start from an empty cache and count the uncached validations."""
+    _validate_and_extract_cached.cache_clear()
+    with patch.object(
+        validation_coordinator,
+        "_validate_and_extract",
+        wraps=validation_coordinator._validate_and_extract,
+    ) as mock:
+        yield mock
+    _validate_and_extract_cached.cache_clear()
+
+
+def test_identical_call_is_served_from_cache(spy):
+    """A second identical call must not validate again."""
+    first = validate_and_extract_code(CODE, "py", {"strict": True})
+    second = validate_and_extract_code(CODE, "py", {"strict": True})
+
+    assert spy.call_count == 1
+    assert _validate_and_extract_cached.cache_info().hits == 1
+    assert first == second
+    assert first[0] is True
+
+
+def test_cached_issues_are_a_fresh_list_per_call(spy):
+    """Callers may mutate the issues without altering later results."""
+    _, _, issues = validate_and_extract_code(CODE, "py")
+    issues.append("mutated")
+
+    _, _, issues_again = validate_and_extract_code(CODE, "py")
+
+    assert "mutated" not in issues_again
+    assert spy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "content,file_extension,options",
+    [
+        (CODE + "\n# changed\n", "py", {"strict": True}),
+        (CODE, "js", {"strict": True}),
+        (CODE, "py", {"strict": False}),
+    ],
+    ids=["content", "extension", "options"],
+)
+def test_changed_input_is_validated_again(spy, content, file_extension, options):
+    """Changing the content, extension or options must recompute."""
+    validate_and_extract_code(CODE, "py", {"strict": True})
+    validate_and_extract_code(content, file_extension, options)
+
+    assert spy.call_count == 2
+    assert _validate_and_extract_cached.cache_info().hits == 0
+
+
+def test_unhashable_options_bypass_the_cache(spy):
+    """Options that can't form a cache key are validated every time."""
+    options = {"allowed": ["print"]}
+    validate_and_extract_code(CODE, "py", options)
+    validate_and_extract_code(CODE, "py", options)
+
+    assert spy.call_count == 2
+    assert _validate_and_extract_cached.cache_info().currsize == 0
@@ -9,69 +9,32 @@ from gollm.validation.validators.incomplete_function_detector import (
 )
 
 
-def test_empty_code():
-    """Test that empty code returns no incomplete functions."""
-    code = ""
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
-    assert not has_incomplete
-    assert len(incomplete_funcs) == 0
-
-
-def test_complete_function():
-    """Test that a complete function is not detected as incomplete."""
-    code = """
+@pytest.mark.parametrize(
+    "code,expected_names",
+    [
+        pytest.param("", [], id="empty"),
+        pytest.param("""
 def add(a, b):
     'Add two numbers.'
     return a + b
-"""
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
-    assert not has_incomplete
-    assert len(incomplete_funcs) == 0
-
-
-def test_pass_function():
-    """Test that a function with only 'pass' is detected as incomplete."""
-    code = """
+""", [], id="complete"),
+        pytest.param("""
 def process_data(data):
     'Process the data.'
     pass
-"""
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
-    assert has_incomplete
-    assert len(incomplete_funcs) == 1
-    assert incomplete_funcs[0]["name"] == "process_data"
-
-
-def test_ellipsis_function():
-    """Test that a function with ellipsis is detected as incomplete."""
-    code = """
+""", ["process_data"], id="pass"),
+        pytest.param("""
 def calculate_total(items):
     'Calculate the total of all items.'
     ...
-"""
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
-    assert has_incomplete
-    assert len(incomplete_funcs) == 1
-    assert incomplete_funcs[0]["name"] == "calculate_total"
-
-
-def test_todo_comment_function():
-    """Test that a function with TODO comments is detected as incomplete."""
-    code = """
+""", ["calculate_total"], id="ellipsis"),
+        pytest.param("""
 def validate_user(user_id):
     'Validate the user ID.'
     # TODO: Implement validation logic
     return True
-"""
-    has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
-    assert has_incomplete
-    assert len(incomplete_funcs) == 1
-    assert incomplete_funcs[0]["name"] == "validate_user"
-
-
-def test_multiple_incomplete_functions():
-    """Test detection of multiple incomplete functions."""
-    code = """
+""", ["validate_user"], id="todo-comment"),
+        pytest.param("""
 def function1():
     pass
 
@@ -82,14 +45,29 @@ def function2():
 def function3():
     # TODO: Implement this
     return None
-"""
+""", ["function1", "function3"], id="multiple"),
+    ],
+)
+def test_contains_incomplete_functions(code, expected_names):
+    """Test which functions are detected as incomplete."""
     has_incomplete, incomplete_funcs = contains_incomplete_functions(code)
+    assert has_incomplete == bool(expected_names)
+    assert sorted(func["name"] for func in incomplete_funcs) == expected_names
+
+
+def test_repeated_detection_returns_fresh_results():
+    """Test that mutating a cached detection result does not leak into the next call."""
+    code = """
+def process_data(data):
+    pass
+"""
+    _, first = contains_incomplete_functions(code)
+    first[0]["name"] = "changed"
+    first.clear()
+    
+    has_incomplete, second = contains_incomplete_functions(code)
     assert has_incomplete
-    assert len(incomplete_funcs) == 2
-    function_names = [func["name"] for func in incomplete_funcs]
-    assert "function1" in function_names
-    assert "function3" in function_names
-    assert "function2" not in function_names
+    assert second[0]["name"] == "process_data"
 
 
 def test_format_for_completion():